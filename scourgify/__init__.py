@@ -8,6 +8,7 @@ All rights reserved
 # Local Imports
 from scourgify.normalize import (
     get_geocoder_normalized_addr,
+    get_geocoder_normalized_addrs,
     normalize_address_record,
     NormalizeAddress
 )
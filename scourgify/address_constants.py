@@ -6,11 +6,23 @@ All rights reserved
 ..codeauthor::Fable Turas <fable@rainsoftware.tech>
 
 """
+# Imports from Standard Library
+import os
+import sys
+
 # Imports from Third Party Modules
 from yamlconf import Config, ConfigError
 
+# maximum number of entries held by each of the memoized cleaning, tagging
+# and normalization functions. Set ADDRESS_CONFIG_CACHE_SIZE=0 to disable
+# memoization.
+try:
+    CACHE_SIZE = int(os.environ.get('ADDRESS_CONFIG_CACHE_SIZE', 4096))
+except ValueError:
+    raise ConfigError('ADDRESS_CONFIG_CACHE_SIZE must be an integer')
+
 KNOWN_ODDITIES = {}
-ABNORMAL_OCCUPANCY_ABBRVS = {}
+ABNORMAL_OCCUPANCY_ABBRVS = frozenset()
 
 PROBLEM_ST_TYPE_ABBRVS = {
     'CT': 'COURT'
@@ -899,6 +911,10 @@ ADDRESS_KEYS = (
 )
 
 
+# see register_refresh_hook
+_REFRESH_HOOKS = []
+
+
 class NormalizationConfig(Config):
     """Config class for GBR"""
     # pylint: disable=too-few-public-methods
@@ -941,12 +957,47 @@ def set_address_constants():
                 org_keys = OCCUPANCY_TYPE_ABBREVIATIONS.keys()
                 new_keys = new_vals.keys()
                 globals()['ABNORMAL_OCCUPANCY_ABBRVS'] = (
-                    set(new_keys) - set(org_keys)
+                    frozenset(new_keys).difference(org_keys)
                 )
             if new_vals and insertion_method in update:
                 globals()[key].update(**new_vals)
             elif new_vals and insertion_method in replace:
                 globals()[key] = new_vals
+    _intern_lookup_constants()
+    for hook in _REFRESH_HOOKS:
+        hook()
+
+
+def register_refresh_hook(hook):
+    """Register a callable to be run whenever set_address_constants is called.
+
+    Modules that build lookups from these constants, or memoize results that
+    depend on them, register a hook to rebuild and reset them so updated
+    constants are picked up.
+    """
+    _REFRESH_HOOKS.append(hook)
+
+
+def _intern_lookup_constants():
+    """Upper case and intern the keys and values of the lookup constants.
+
+    Parsed address values are always upper case, so custom config values
+    are normalized to match, and the tables are updated in place so modules
+    that imported them see the change.
+    """
+    for key in ('DIRECTIONAL_REPLACEMENTS', 'STATE_ABBREVIATIONS',
+                'STREET_TYPE_ABBREVIATIONS'):
+        constant = globals()[key]
+        for abbr_key, abbr_val in constant.items():
+            if not (isinstance(abbr_key, str) and isinstance(abbr_val, str)):
+                msg = "{} keys and values must be strings, not {!r}: {!r}"
+                raise ConfigError(msg.format(key, abbr_key, abbr_val))
+        interned = {
+            sys.intern(abbr_key.upper()): sys.intern(abbr_val.upper())
+            for abbr_key, abbr_val in constant.items()
+        }
+        constant.clear()
+        constant.update(interned)
 
 
 set_address_constants()
@@ -9,19 +9,30 @@ All rights reserved
 """
 
 # Imports from Standard Library
+import functools
 import re
+import string
 import unicodedata
-from typing import Any, Optional, Sequence, Union
+from typing import (
+    Any,
+    Iterable,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
 
 # Imports from Third Party Modules
 import usaddress
 
 # Local Imports
 from scourgify.address_constants import (
+    CACHE_SIZE,
     KNOWN_ODDITIES,
     OCCUPANCY_TYPE_ABBREVIATIONS,
     PROBLEM_ST_TYPE_ABBRVS,
-    AMBIGUOUS_DIRECTIONALS
+    AMBIGUOUS_DIRECTIONALS,
+    register_refresh_hook,
 )
 
 # Setup
@@ -41,13 +52,182 @@ STRIP_CHAR_CATS = (
 STRIP_PUNC_CATS = ('Z', 'Pd')
 STRIP_ALL_CATS = STRIP_CHAR_CATS + STRIP_PUNC_CATS
 
+# frozenset copies, so clean_upper can key its cached translation tables on
+# them without copying on every call
+_ALLOWED_CHARS = frozenset(ALLOWED_CHARS)
+_EXCLUDE_ALL = frozenset(EXCLUDE_ALL)
+_STRIP_CHAR_CATS = frozenset(STRIP_CHAR_CATS)
+
+# ord('⁄'), the fraction slash produced by NFKD normalization of fractions
+_FRACTION_SLASH = 8260
+
+# periods not followed by a digit (ie not decimal points)
+_NON_DECIMAL_PERIOD_PATTERN = re.compile(r'\.(?!\d)')
+
+# strings made up solely of these characters are not altered by
+# clean_upper in pre_clean_addr_str
+_PRE_CLEANED_PATTERN = re.compile(r'[A-Z0-9 #&/(),-]*')
+
+_ASCII_UPPER_TABLE = bytes.maketrans(
+    string.ascii_lowercase.encode('ascii'),
+    string.ascii_uppercase.encode('ascii')
+)
+
 # Data Structure Definitions
 
+
+class _CategoryTranslationTable(dict):
+    """str.translate table mapping characters by unicodedata category.
+
+    Entries are populated on first lookup, so each character ordinal is only
+    classified once per table. Characters in removal_cats that are not in
+    exclude map to None, other dash type characters map to a hyphen, the
+    fraction slash maps to '/', and all remaining characters map to their
+    upper case form, so removal and upper casing happen in a single pass.
+    """
+
+    def __init__(self, removal_cats, exclude):
+        super(_CategoryTranslationTable, self).__init__()
+        self.removal_cats = removal_cats
+        self.exclude = exclude
+
+    def __missing__(self, ordinal):
+        # convert fraction slash (ie 1⁄2) to solidus before classifying
+        char = '/' if ordinal == _FRACTION_SLASH else chr(ordinal)
+        # categories are two chars; removal_cats holds whole categories or
+        # their single char major class (ie 'Pd' or 'P').
+        category = unicodedata.category(char)
+        if ((category in self.removal_cats
+                or category[0] in self.removal_cats)
+                and ord(char) not in self.exclude):
+            char = None
+        elif category == 'Pd':
+            char = '-'
+        else:
+            char = char.upper()
+        self[ordinal] = char
+        return char
+
+
 # Private Functions
 
 
+def _compile_substrings_pattern(substrings, whole_words=False):
+    # type: (Iterable[str], Optional[bool]) -> Optional[Pattern]
+    """Compile substrings into a single alternation pattern.
+
+    Longer substrings are listed first so overlapping matches resolve to the
+    leftmost-longest substring, allowing all substrings to be replaced in one
+    pass.
+
+    :param substrings: sub-strings to be matched
+    :type substrings: Iterable[str]
+    :param whole_words: bool indicating that matches must be delimited by
+        white space or the ends of the string.
+    :type whole_words: bool
+    :return: compiled pattern, or None if there are no substrings.
+    :rtype: Pattern | None
+    """
+    substrings = sorted(substrings, key=len, reverse=True)
+    if not substrings:
+        return None
+    pattern = '|'.join(re.escape(substring) for substring in substrings)
+    if whole_words:
+        pattern = r'(?<!\S)(?:{})(?!\S)'.format(pattern)
+    return re.compile(pattern)
+
+
+def _build_constant_lookups():
+    # type: () -> None
+    """Build the lookups derived from address_constants.
+
+    Sets _ODDITIES_PATTERN and _OCCUPANCY_TYPE_PATTERN, matching
+    KNOWN_ODDITIES and OCCUPANCY_TYPE_ABBREVIATIONS keys, and
+    _OCCUPANCY_TYPES, the occupancy types in both long and abbreviated form.
+    """
+    global _ODDITIES_PATTERN, _OCCUPANCY_TYPE_PATTERN, _OCCUPANCY_TYPES
+    _ODDITIES_PATTERN = _compile_substrings_pattern(KNOWN_ODDITIES)
+    _OCCUPANCY_TYPE_PATTERN = _compile_substrings_pattern(
+        OCCUPANCY_TYPE_ABBREVIATIONS, whole_words=True
+    )
+    _OCCUPANCY_TYPES = frozenset(OCCUPANCY_TYPE_ABBREVIATIONS).union(
+        OCCUPANCY_TYPE_ABBREVIATIONS.values()
+    )
+
+
+_build_constant_lookups()
+
+
+def _refresh_constant_lookups():
+    # type: () -> None
+    """Rebuild the oddity and occupancy lookups and clear cleaning caches."""
+    _build_constant_lookups()
+    tag_address.cache_clear()
+    pre_clean_addr_str.cache_clear()
+    post_clean_addr_str.cache_clear()
+
+
+def _is_pre_cleaned(addr_str):
+    # type: (str) -> bool
+    """Determine whether addr_str would be unchanged by pre-cleaning.
+
+    True for upper case ascii strings made up only of characters that
+    pre-cleaning leaves in place, and that contain no known oddities or
+    ambiguous directionals. White space may still need to be collapsed.
+
+    :param addr_str: raw address string
+    :type addr_str: str
+    :return: bool
+    :rtype: bool
+    """
+    return bool(
+        _PRE_CLEANED_PATTERN.fullmatch(addr_str)
+        and not (_ODDITIES_PATTERN and _ODDITIES_PATTERN.search(addr_str))
+        and not any(
+            direction in addr_str for direction in AMBIGUOUS_DIRECTIONALS
+        )
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _get_translation_table(removal_cats, exclude):
+    # type: (frozenset, frozenset) -> _CategoryTranslationTable
+    """Get the shared translation table for removal_cats and exclude."""
+    return _CategoryTranslationTable(removal_cats, exclude)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_ascii_deletions(removal_cats, exclude):
+    # type: (frozenset, frozenset) -> bytes
+    """Get the ascii bytes removed for removal_cats and exclude."""
+    table = _get_translation_table(removal_cats, exclude)
+    return bytes(ordinal for ordinal in range(128) if table[ordinal] is None)
+
+
 # Public Classes and Functions
 
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def tag_address(addr_str):
+    # type: (str) -> Tuple[Tuple[Tuple[str, str], ...], str]
+    """Tag addr_str with usaddress, memoizing results for repeated strings.
+
+    CRF tagging is the most expensive step of normalization, and address and
+    line 2 strings (ie APT 2, UNIT A) recur heavily in bulk processing, so
+    results are cached per process. Tagged components are returned as a tuple
+    of (label, value) pairs so the cached result cannot be altered; callers
+    build their own mapping from it. usaddress errors are raised, and so are
+    never cached. Use tag_address.cache_clear() to reset.
+
+    :param addr_str: address string to be tagged.
+    :type addr_str: str
+    :return: tagged (label, value) pairs and the usaddress address type.
+    :rtype: tuple
+    """
+    tagged_addr, address_type = usaddress.tag(addr_str)
+    return tuple(tagged_addr.items()), address_type
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
 def pre_clean_addr_str(addr_str, state=None):
     # type: (str, Optional[str]) -> str
     """Remove any known undesirable sub-strings and special characters.
@@ -62,6 +242,9 @@ def pre_clean_addr_str(addr_str, state=None):
     processing of unparseable addresses and should be further cleaned
     post_processing. (see post_clean_addr_str).
 
+    Results are memoized per process since raw addresses repeat heavily in
+    bulk processing; use pre_clean_addr_str.cache_clear() to reset.
+
     :param addr_str: raw address string
     :type addr_str: str
     :param state: optional string containing normalized state data.
@@ -69,24 +252,29 @@ def pre_clean_addr_str(addr_str, state=None):
     :return: cleaned string
     :rtype: str
     """
-    # replace any easily handled, undesirable sub-strings
-    if any(oddity in addr_str for oddity in KNOWN_ODDITIES.keys()):
-        for key, replacement in KNOWN_ODDITIES.items():      # pragma: no cover
-            addr_str = addr_str.replace(key, replacement)
-
-    # remove non-decimal point period chars.
-    if '.' in addr_str:                                      # pragma: no cover
-        addr_str = clean_period_char(addr_str)
-
-    addr_str = pre_clean_directionals(addr_str)
-
-    # remove special characters per USPS pub 28, except & which impacts
-    # intersection addresses, and - which impacts range addresses and zipcodes.
-    # ',', '(' and ')' are also left for potential use in additional line 2
-    # processing functions
-    addr_str = clean_upper(
-        addr_str, exclude=EXCLUDE_ALL, removal_cats=STRIP_CHAR_CATS
-    )
+    if _is_pre_cleaned(addr_str):
+        # nothing to replace or remove, so only extra white space is cleaned
+        addr_str = ' '.join(addr_str.split())
+    else:
+        # replace any easily handled, undesirable sub-strings
+        if _ODDITIES_PATTERN:
+            addr_str = _ODDITIES_PATTERN.sub(
+                lambda match: KNOWN_ODDITIES[match.group()], addr_str
+            )
+
+        # remove non-decimal point period chars.
+        if '.' in addr_str:                                  # pragma: no cover
+            addr_str = clean_period_char(addr_str)
+
+        addr_str = pre_clean_directionals(addr_str)
+
+        # remove special characters per USPS pub 28, except & which impacts
+        # intersection addresses, and - which impacts range addresses and
+        # zipcodes. ',', '(' and ')' are also left for potential use in
+        # additional line 2 processing functions
+        addr_str = clean_upper(
+            addr_str, exclude=_EXCLUDE_ALL, removal_cats=_STRIP_CHAR_CATS
+        )
 
     # to prevent any potential confusion between CT = COURT v CT = Connecticut,
     # clean_ambiguous_street_types is not applied if state is CT.
@@ -112,18 +300,25 @@ def clean_ambiguous_street_types(addr_str):
     """
     if addr_str:
         split_addr = addr_str.split()
-        for key in PROBLEM_ST_TYPE_ABBRVS:
-            if key in split_addr:
-                split_addr[split_addr.index(key)] = PROBLEM_ST_TYPE_ABBRVS[key]
-                addr_str = ' '.join(split_addr)
-                break
+        cleaned = False
+        for index, part in enumerate(split_addr):
+            replacement = PROBLEM_ST_TYPE_ABBRVS.get(part)
+            if replacement is not None:
+                split_addr[index] = replacement
+                cleaned = True
+        if cleaned:
+            addr_str = ' '.join(split_addr)
     return addr_str
 
 
+@functools.lru_cache(maxsize=CACHE_SIZE)
 def post_clean_addr_str(addr_str):
     # type: (Union[str, None], Optional[bool]) -> str
     """Remove any special chars or extra white space remaining post-processing.
 
+    Results are memoized per process; use post_clean_addr_str.cache_clear()
+    to reset.
+
     :param addr_str: post-processing address string.
     :type addr_str: str | None
     :param is_line2: optional boolean to trigger extra line 2 processing.
@@ -133,7 +328,7 @@ def post_clean_addr_str(addr_str):
     """
     if addr_str:
         addr_str = clean_upper(
-            addr_str, exclude=ALLOWED_CHARS, removal_cats=STRIP_CHAR_CATS
+            addr_str, exclude=_ALLOWED_CHARS, removal_cats=_STRIP_CHAR_CATS
         )
     return addr_str
 
@@ -141,14 +336,12 @@ def post_clean_addr_str(addr_str):
 def _parse_occupancy(addr_line_2):
     occupancy = None
     if addr_line_2:
-        parsed = None
         # first try usaddress parsing labels
         try:
-            parsed = usaddress.tag(addr_line_2)
+            tagged_items, _ = tag_address(addr_line_2)
         except usaddress.RepeatedLabelError:
-            pass
-        if parsed:
-            occupancy = parsed[0].get('OccupancyIdentifier')
+            tagged_items = ()
+        occupancy = dict(tagged_items).get('OccupancyIdentifier')
     return occupancy
 
 
@@ -169,34 +362,29 @@ def strip_occupancy_type(addr_line_2):
         # if that doesn't work, clean abbrevs and try again
         if not occupancy:
             parts = str(addr_line_2).split()
-            for p in parts:
-                if p in OCCUPANCY_TYPE_ABBREVIATIONS:
-                    addr_line_2 = addr_line_2.replace(
-                        p, OCCUPANCY_TYPE_ABBREVIATIONS[p]
-                    )
+            if _OCCUPANCY_TYPE_PATTERN:
+                addr_line_2 = _OCCUPANCY_TYPE_PATTERN.sub(
+                    lambda match: OCCUPANCY_TYPE_ABBREVIATIONS[match.group()],
+                    addr_line_2
+                )
             occupancy = _parse_occupancy(addr_line_2)
 
             # if that doesn't work, dissect it manually
             if not occupancy:
                 occupancy = addr_line_2
-                types = (
-                    list(OCCUPANCY_TYPE_ABBREVIATIONS.keys())
-                    + list(OCCUPANCY_TYPE_ABBREVIATIONS.values())
-                )
                 if parts and len(parts) > 1:
-                    ids = [p for p in parts if p not in types]
-                    print(ids)
+                    ids = [p for p in parts if p not in _OCCUPANCY_TYPES]
                     occupancy = ' '.join(ids)
 
     return occupancy
 
 
 def clean_upper(text,                           # type: Any
-                exclude=None,                   # type: Optional[Sequence[int]]
-                removal_cats=STRIP_CHAR_CATS,   # type: Optional[Sequence[str]]
+                exclude=None,                   # type: Optional[Iterable[int]]
+                removal_cats=_STRIP_CHAR_CATS,  # type: Optional[Iterable[str]]
                 strip_spaces=False              # type: Optional[bool]
                 ):
-    # type: (str, Optional[Sequence[int]], Optional[Sequence[str]]) -> str
+    # type: (str, Optional[Iterable[int]], Optional[Iterable[str]]) -> str
     """
     Return text as upper case unicode string and remove unwanted characters.
     Defaults to STRIP_CHARS e.g all  whitespace, punctuation etc
@@ -213,32 +401,42 @@ def clean_upper(text,                           # type: Any
     :return: cleaned uppercase unicode string
     :rtype: str
     """
-    exclude = exclude or []
+    exclude = exclude or ()
     # coerce ints etc to str
     if not isinstance(text, str):  # pragma: no cover
         text = str(text)
-    # catch and convert fractions
-    text = unicodedata.normalize('NFKD', text)
-    text = text.translate({8260: '/'})
-
-    # evaluate string without commas (,) or ampersand (&) to determine if
-    # further processing is necessary
-    alnum_text = text.translate({44: None, 38: None})
-
-    # remove unwanted non-alphanumeric characters and convert all dash type
-    # characters to hyphen
-    if not alnum_text.replace(' ', '').isalnum():
-        for char in text:
-            if (unicodedata.category(char).startswith(removal_cats)
-                    and ord(char) not in exclude):
-                text = text.translate({ord(char): None})
-            elif unicodedata.category(char).startswith('Pd'):
-                text = text.translate({ord(char): '-'})
+    if text.isascii():
+        # NFKD normalization and dash conversion do not alter ascii text, so
+        # removal and upper casing are applied in a single bytes pass.
+        data = text.encode('ascii')
+        deletions = b''
+        if not data.translate(None, b' ,&').isalnum():
+            deletions = _get_ascii_deletions(
+                frozenset(removal_cats), frozenset(exclude)
+            )
+        text = data.translate(_ASCII_UPPER_TABLE, deletions).decode('ascii')
+    else:
+        # catch fractions; fraction slashes are converted with the
+        # translation table below.
+        text = unicodedata.normalize('NFKD', text)
+
+        # evaluate string without commas (,) or ampersand (&) to determine if
+        # further processing is necessary
+        alnum_text = text.translate({44: None, 38: None})
+
+        # remove unwanted non-alphanumeric characters, convert all dash
+        # type characters to hyphen and convert to uppercase
+        if not alnum_text.replace(' ', '').isalnum():
+            text = text.translate(_get_translation_table(
+                frozenset(removal_cats), frozenset(exclude)
+            ))
+        else:
+            text = text.upper()
     join_char = ' '
     if strip_spaces:
         join_char = ''
-    # remove extra spaces and convert to uppercase
-    return join_char.join(text.split()).upper()
+    # remove extra spaces
+    return join_char.join(text.split())
 
 
 def clean_period_char(text):
@@ -249,8 +447,9 @@ def clean_period_char(text):
     :return: cleaned string
     :rtype: str
     """
-    period_pattern = re.compile(r'\.(?!\d)')
-    return re.sub(period_pattern, '', text)
+    if '.' not in text:
+        return text
+    return _NON_DECIMAL_PERIOD_PATTERN.sub('', text)
 
 
 def pre_clean_directionals(text):
@@ -266,3 +465,6 @@ def pre_clean_directionals(text):
     for direction, abbr in AMBIGUOUS_DIRECTIONALS.items():
         text = text.upper().replace(direction, abbr)
     return text
+
+
+register_refresh_hook(_refresh_constant_lookups)
@@ -16,6 +16,7 @@ Custom errors pertaining to address normalization.
 
 class AddressNormalizationError(Exception):
     """Indicates error during normalization"""
+    __slots__ = ('error', 'title')
     TITLE = None
     MESSAGE = None
 
@@ -26,33 +27,35 @@ class AddressNormalizationError(Exception):
         super(AddressNormalizationError, self).__init__(*args)
 
     def __str__(self):
-        msg = "{}: {}".format(self.title, self.error)
+        msg = f"{self.title}: {self.error}"
         if len(self.args) > 2:
-            msg = "{}, {}".format(
-                msg, ', '.join(str(a) for a in self.args[2:])
-            )
+            msg = f"{msg}, {', '.join(str(a) for a in self.args[2:])}"
         return msg
 
 
 class AmbiguousAddressError(AddressNormalizationError):
     """Indicates an error from ambiguous addresses or address parts."""
+    __slots__ = ()
     MESSAGE = "This address contains ambiguous elements."
     TITLE = "AMBIGUOUS ADDRESS"
 
 
 class UnParseableAddressError(AddressNormalizationError):
     """Indicates an error from addresses that cannot be parsed."""
+    __slots__ = ()
     MESSAGE = "Unable to break this address into its component parts"
     TITLE = "UNPARSEABLE ADDRESS"
 
 
 class IncompleteAddressError(AddressNormalizationError):
     """Indicates error from addresses that don't have enough data to index."""
+    __slots__ = ()
     MESSAGE = "This address is missing one or more required elements"
     TITLE = "INCOMPLETE ADDRESS"
 
 
 class AddressValidationError(AddressNormalizationError):
     """Indicates address elements that don't meet format standards."""
+    __slots__ = ()
     MESSAGE = "Address contains invalid formatting"
     TITLE = "ADDRESS FORMAT VALIDATION"
@@ -20,12 +20,14 @@ from __future__ import annotations
 
 # Imports from Standard Library
 
-from string import Template
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from collections import OrderedDict  # noqa # pylint: disable=unused-import
 from typing import (  # noqa # pylint: disable=unused-import
     Callable,
     Mapping,
     MutableMapping,
+    NamedTuple,
     Optional,
     Sequence,
     Union,
@@ -39,6 +41,7 @@ import usaddress
 from scourgify.address_constants import (
     ABNORMAL_OCCUPANCY_ABBRVS,
     ADDRESS_KEYS,
+    CACHE_SIZE,
     CITY_ABBREVIATIONS,
     DIRECTIONAL_REPLACEMENTS,
     LONGHAND_DIRECTIONALS,
@@ -46,12 +49,18 @@ from scourgify.address_constants import (
     OCCUPANCY_TYPE_ABBREVIATIONS,
     STATE_ABBREVIATIONS,
     STREET_TYPE_ABBREVIATIONS,
+    register_refresh_hook,
 )
-from scourgify.cleaning import (
+from scourgify.cleaning import (  # noqa # pylint: disable=unused-import
+    # STRIP_CHAR_CATS and STRIP_PUNC_CATS remain importable from normalize
+    STRIP_ALL_CATS,
+    STRIP_CHAR_CATS,
+    STRIP_PUNC_CATS,
     clean_upper,
     post_clean_addr_str,
     pre_clean_addr_str,
     strip_occupancy_type,
+    tag_address,
 )
 from scourgify.exceptions import (
     AddressNormalizationError,
@@ -68,7 +77,7 @@ from scourgify.validations import (
 
 # Constants
 
-LINE1_USADDRESS_LABELS = (
+LINE1_USADDRESS_LABELS = frozenset((
     'AddressNumber',
     'StreetName',
     'AddressNumberPrefix',
@@ -86,40 +95,275 @@ LINE1_USADDRESS_LABELS = (
     'SecondStreetNamePreType',
     'LandmarkName',
     'CornerOf',
-    'IntersectionSeparator',
     'BuildingName',
-)
-LINE2_USADDRESS_LABELS = (
+))
+LINE2_USADDRESS_LABELS = frozenset((
     'OccupancyType',
     'OccupancyIdentifier',
     'SubaddressIdentifier',
     'SubaddressType',
-)
+))
 
-LAST_LINE_LABELS = (
+LAST_LINE_LABELS = frozenset((
     'PlaceName',
     'StateName',
     'ZipCode',
-)
+))
 
-AMBIGUOUS_LABELS = (
+AMBIGUOUS_LABELS = frozenset((
     'Recipient',
     'USPSBoxType',
     'USPSBoxID',
     'USPSBoxGroupType',
     'USPSBoxGroupID',
-    'NotAddress'
+    'NotAddress',
+))
+
+# ordinal indicators depend only on the last two digits of a number; 11, 12
+# and 13 (and so 111, 212 etc) take 'th'.
+_ORDINAL_INDICATORS = tuple(
+    'th' if 10 <= num <= 19 else {1: 'st', 2: 'nd', 3: 'rd'}.get(
+        num % 10, 'th'
+    )
+    for num in range(100)
 )
 
-STRIP_CHAR_CATS = (
-    'M', 'S', 'C', 'Nl', 'No', 'Pc', 'Ps', 'Pe', 'Pi', 'Pf', 'Po'
+# usaddress labels for the values handled by normalize_directionals and
+# normalize_street_types
+_DIRECTIONAL_TAGS = (
+    'StreetNamePreDirectional',
+    'StreetNamePostDirectional',
+    'SecondStreetNamePreDirectional',
+    'SecondStreetNamePostDirectional',
 )
-STRIP_PUNC_CATS = ('Z', 'Pd')
-STRIP_ALL_CATS = STRIP_CHAR_CATS + STRIP_PUNC_CATS
+_STREET_TYPE_TAGS = (
+    'StreetNamePreType',
+    'StreetNamePostType',
+    'SecondStreetNamePreType',
+    'SecondStreetNamePostType',
+)
+
+# post type labels of the street names handled by normalize_numbered_streets
+_POST_TYPE_TAGS = {
+    'StreetName': 'StreetNamePostType',
+    'SecondStreetName': 'SecondStreetNamePostType',
+}
+
+_STRIP_ALL_CATS = frozenset(STRIP_ALL_CATS)
+
+# already normalized 2 char state abbreviations
+_STATE_CODES = frozenset(STATE_ABBREVIATIONS.values())
+
+# Data Structure Definitions
+
+
+class _GeocodedAddress(NamedTuple):
+    """Address fields of a geocoder.google result."""
+    housenumber: str | None
+    street: str | None
+    subpremise: str | None
+    city: str | None
+    state: str | None
+    postal: str | None
 
 
 # Private Functions
 
+@lru_cache(maxsize=CACHE_SIZE)
+def _normalize_addr_str(addr_str: str, line2: str | None, city: str | None,
+                        state: str | None, zipcode: str | None,
+                        addtl_funcs: tuple | None,
+                        long_hand: bool) -> OrderedDict:
+    """Memoized implementation of normalize_addr_str.
+
+    Address datasets repeat the same street, city, state and zip combinations
+    heavily, so results are cached on the full argument tuple. Calls with
+    addtl_funcs, or with unhashable arguments, must use the uncached
+    _normalize_addr_str.__wrapped__ instead. Errors are raised, and therefore
+    never cached.
+    """
+    # get address parsed into usaddress components.
+    error = None
+    parsed_addr = None
+    addr_str = pre_clean_addr_str(addr_str, normalize_state(state))
+    try:
+        parsed_addr = parse_address_string(addr_str)
+    except (usaddress.RepeatedLabelError, AmbiguousAddressError) as err:
+        error = err
+        if not line2 and addtl_funcs:
+            for func in addtl_funcs:
+                try:
+                    line1, line2 = func(addr_str)
+                except ValueError:
+                    # try a different additional processing function
+                    continue
+                # parse refactored line_1 in place of addr_str, keeping
+                # line_2 as returned.
+                addr_str = pre_clean_addr_str(line1, normalize_state(state))
+                try:
+                    parsed_addr = parse_address_string(addr_str)
+                    error = None
+                except (usaddress.RepeatedLabelError,
+                        AmbiguousAddressError) as err:
+                    error = err
+                break
+    return _normalize_parsed_addr(
+        addr_str, parsed_addr, error, line2, city, state, zipcode, long_hand
+    )
+
+
+def _normalize_parsed_addr(addr_str: str, parsed_addr: OrderedDict | None,
+                           error: Exception | None, line2: str | None,
+                           city: str | None, state: str | None,
+                           zipcode: str | None,
+                           long_hand: bool) -> OrderedDict:
+    """Build the normalized address record from a usaddress parse.
+
+    :param addr_str: pre-cleaned address string that was parsed.
+    :param parsed_addr: usaddress components of addr_str, or None if it could
+        not be parsed.
+    :param error: error raised while parsing addr_str, if any.
+    :param line2: optional str containing occupancy or sub-address data
+        (eg: Unit, Apt, Lot).
+    :param city: optional str city name that was not parsed from addr_str.
+    :param state: optional str state name that was not parsed from addr_str.
+    :param zipcode: optional str postal code that was not parsed from
+        addr_str.
+    :param long_hand: bool indicating whether to use long hand versions of
+        directionals and street types in the output.
+    :return: address dict with uppercase parsed and normalized address values.
+    :raises UnParseableAddressError: if the address could not be parsed.
+    """
+    # reparse with any supplied address parts; with none supplied the full
+    # address is addr_str itself and would parse identically.
+    if (parsed_addr and not parsed_addr.get('StreetName')
+            and (line2 or city or state or zipcode)):
+        addr_dict = dict(
+            address_line_1=addr_str, address_line_2=line2, city=city,
+            state=state, postal_code=zipcode
+        )
+        full_addr = format_address_record(addr_dict)
+        try:
+            parsed_addr = parse_address_string(full_addr)
+        except (usaddress.RepeatedLabelError, AmbiguousAddressError) as err:
+            parsed_addr = None
+            error = err
+
+    if parsed_addr:
+        parsed_addr = normalize_address_components(
+            parsed_addr, long_hand=long_hand
+        )
+        zipcode = get_parsed_values(
+            parsed_addr, zipcode, 'ZipCode', addr_str
+        )
+        city = get_parsed_values(
+            parsed_addr, city, 'PlaceName', addr_str
+        )
+        state = get_parsed_values(
+            parsed_addr, state, 'StateName', addr_str
+        )
+        state = normalize_state(state)
+
+        # assumes if line2 is passed in that it need not be parsed from
+        # addr_str. Primarily used to allow advanced processing of otherwise
+        # unparsable addresses.
+        line2 = line2 if line2 else get_normalized_line_segment(
+            parsed_addr, LINE2_USADDRESS_LABELS
+        )
+        line2 = post_clean_addr_str(line2) if line2 else line2
+        # line 1 is fully post cleaned in get_normalized_line_segment.
+        line1 = get_normalized_line_segment(
+            parsed_addr, LINE1_USADDRESS_LABELS
+        )
+        validate_parens_groups_parsed(line1)
+    else:
+        # line1 is set to addr_str so complete dict can be passed to error.
+        line1 = addr_str
+
+    addr_rec = OrderedDict(
+        address_line_1=line1, address_line_2=line2, city=city,
+        state=state, postal_code=zipcode
+    )
+    if error:
+        raise UnParseableAddressError(None, None, addr_rec)
+    else:
+        return addr_rec
+
+
+def _normalize_numbered_street(parsed_addr: OrderedDict, tag: str,
+                               long_hand: bool = False) -> None:
+    """Append the ordinal indicator to a numbered street name in place."""
+    street_name = parsed_addr[tag]
+    # limits updates to numbered street names that include a post street
+    # type, since an ordinal indicator would be inappropriate for some
+    # numbered streets (ie. Country Road 97).
+    if _POST_TYPE_TAGS[tag] in parsed_addr and street_name.isdecimal():
+        cardinal = int(street_name)
+        parsed_addr[tag] = f'{cardinal}{get_ordinal_indicator(cardinal)}'
+
+
+def _normalize_directional(parsed_addr: OrderedDict, tag: str,
+                           long_hand: bool = False) -> None:
+    """Change a directional to its standard abbreviation in place."""
+    # remove spaces, punctuation, hyphens etc so two part directions
+    # conform to a single word standard. Convert to upper case
+    dir_str = clean_upper(
+        parsed_addr[tag], exclude=(), removal_cats=_STRIP_ALL_CATS,
+        strip_spaces=True
+    )
+    if dir_str in DIRECTIONAL_REPLACEMENTS:
+        dir_str = DIRECTIONAL_REPLACEMENTS[dir_str]
+    if long_hand:
+        dir_str = LONGHAND_DIRECTIONALS[dir_str]
+    parsed_addr[tag] = dir_str
+
+
+def _normalize_street_type(parsed_addr: OrderedDict, tag: str,
+                           long_hand: bool = False) -> None:
+    """Change a street type to its accepted abbreviation in place."""
+    street_type = parsed_addr[tag]
+    # update the street type only if a new abbreviation is found.
+    street_type = STREET_TYPE_ABBREVIATIONS.get(street_type) or street_type
+    if long_hand:
+        street_type = LONGHAND_STREET_TYPES[street_type]
+    parsed_addr[tag] = street_type
+
+
+# normalizers applied by normalize_address_components, by usaddress label
+_TAG_HANDLERS = {
+    'StreetName': _normalize_numbered_street,
+    'SecondStreetName': _normalize_numbered_street,
+    **dict.fromkeys(_DIRECTIONAL_TAGS, _normalize_directional),
+    **dict.fromkeys(_STREET_TYPE_TAGS, _normalize_street_type),
+}
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _geocode_google(address: str) -> _GeocodedAddress:
+    """Geocode address with geocoder.google, caching successful results.
+
+    Google geocoding requests are slow and metered, so results are reused
+    for repeated address strings within a process. Only the address fields
+    are kept, not the full response with its session and raw json. Failed
+    lookups raise LookupError, and so are not cached and will be retried.
+    """
+    geo_resp = geocoder.google(address)
+    if not geo_resp.ok:
+        raise LookupError(f'Unable to geocode address: {address}')
+    return _GeocodedAddress(
+        geo_resp.housenumber, geo_resp.street, geo_resp.subpremise,
+        geo_resp.city, geo_resp.state, geo_resp.postal
+    )
+
+
+def _refresh_constant_lookups() -> None:
+    """Rebuild _STATE_CODES and clear the normalization caches."""
+    global _STATE_CODES
+    _STATE_CODES = frozenset(STATE_ABBREVIATIONS.values())
+    _normalize_addr_str.cache_clear()
+    normalize_state.cache_clear()
+
+
 # Public Classes and Functions
 
 def normalize_address_record(address: str | dict, addr_map: dict = None,
@@ -194,79 +438,20 @@ def normalize_addr_str(addr_str: str, line2: str = None, city: str = None,
     :return: address dict with uppercase parsed and normalized address values.
     :rtype: Mapping[str, str]
     """
-    # get address parsed into usaddress components.
-    error = None
-    parsed_addr = None
-    addr_str = pre_clean_addr_str(addr_str, normalize_state(state))
-    try:
-        parsed_addr = parse_address_string(addr_str)
-    except (usaddress.RepeatedLabelError, AmbiguousAddressError) as err:
-        error = err
-        if not line2 and addtl_funcs:
-            for func in addtl_funcs:
-                try:
-                    line1, line2 = func(addr_str)
-                    error = False
-                    # send refactored line_1 and line_2 back through processing
-                    return normalize_addr_str(
-                        line1, line2=line2, city=city,
-                        state=state, zipcode=zipcode, long_hand=long_hand
-                    )
-                except ValueError:
-                    # try a different additional processing function
-                    pass
-
-    if parsed_addr and not parsed_addr.get('StreetName'):
-        addr_dict = dict(
-            address_line_1=addr_str, address_line_2=line2, city=city,
-            state=state, postal_code=zipcode
-        )
-        full_addr = format_address_record(addr_dict)
-        try:
-            parsed_addr = parse_address_string(full_addr)
-        except (usaddress.RepeatedLabelError, AmbiguousAddressError) as err:
-            parsed_addr = None
-            error = err
-
-    if parsed_addr:
-        parsed_addr = normalize_address_components(
-            parsed_addr, long_hand=long_hand
-        )
-        zipcode = get_parsed_values(
-            parsed_addr, zipcode, 'ZipCode', addr_str
-        )
-        city = get_parsed_values(
-            parsed_addr, city, 'PlaceName', addr_str
-        )
-        state = get_parsed_values(
-            parsed_addr, state, 'StateName', addr_str
-        )
-        state = normalize_state(state)
-
-        # assumes if line2 is passed in that it need not be parsed from
-        # addr_str. Primarily used to allow advanced processing of otherwise
-        # unparsable addresses.
-        line2 = line2 if line2 else get_normalized_line_segment(
-            parsed_addr, LINE2_USADDRESS_LABELS
-        )
-        line2 = post_clean_addr_str(line2)
-        # line 1 is fully post cleaned in get_normalized_line_segment.
-        line1 = get_normalized_line_segment(
-            parsed_addr, LINE1_USADDRESS_LABELS
+    addr_parts = (addr_str, line2, city, state, zipcode)
+    if addtl_funcs:
+        # caller supplied funcs need not be hashable, and should not be kept
+        # alive by the cache, so these calls are not memoized.
+        return _normalize_addr_str.__wrapped__(
+            *addr_parts, tuple(addtl_funcs), long_hand
         )
-        validate_parens_groups_parsed(line1)
-    else:
-        # line1 is set to addr_str so complete dict can be passed to error.
-        line1 = addr_str
-
-    addr_rec = OrderedDict(
-        address_line_1=line1, address_line_2=line2, city=city,
-        state=state, postal_code=zipcode
-    )
-    if error:
-        raise UnParseableAddressError(None, None, addr_rec)
-    else:
-        return addr_rec
+    try:
+        hash(addr_parts)
+    except TypeError:
+        return _normalize_addr_str.__wrapped__(*addr_parts, None, long_hand)
+    # the cached record is shared between calls; hand back a copy so callers
+    # are free to mutate the result.
+    return OrderedDict(_normalize_addr_str(*addr_parts, None, long_hand))
 
 
 def normalize_addr_dict(addr_dict: dict, addr_map: dict = None,
@@ -296,7 +481,7 @@ def normalize_addr_dict(addr_dict: dict, addr_map: dict = None,
     """
     if addr_map:
         addr_dict = {key: addr_dict.get(val) for key, val in addr_map.items()}
-    addr_dict = validate_address_components(addr_dict, strict=strict)
+    addr_dict = validate_address_components(addr_dict, strict)
 
     # line 1 and line 2 elements are combined to ensure consistent processing
     # whether the line 2 elements are pre-parsed or included in line 1
@@ -338,12 +523,12 @@ def parse_address_string(addr_str: str) -> dict:
     :return: usaddress OrderedDict
     :rtype: MutableMapping
     """
-    parsed_results = usaddress.tag(addr_str)
-    parsed_addr = parsed_results[0]
+    tagged_items, address_type = tag_address(addr_str)
+    parsed_addr = OrderedDict(tagged_items)
     # if the address is parseable but some form of ambiguity is found that
     # may result in data corruption NormalizationError is raised.
-    if (parsed_results[1] == 'Ambiguous' or
-            any(key in AMBIGUOUS_LABELS for key in parsed_addr.keys())):
+    if (address_type == 'Ambiguous' or
+            not AMBIGUOUS_LABELS.isdisjoint(parsed_addr)):
         raise AmbiguousAddressError()
     parsed_addr = handle_abnormal_occupancy(parsed_addr, addr_str)
     return parsed_addr
@@ -371,28 +556,16 @@ def handle_abnormal_occupancy(parsed_addr: OrderedDict,
     :return: parsed address
     :rtype: OrderedDict
     """
-    occupancy_id_key = None
     occupany_type_key = 'OccupancyType'
+    occupancy_id_key = 'OccupancyIdentifier'
     street_type_key = 'StreetNamePostType'
-    occupany_type_keys = (occupany_type_key, 'SubaddressType')
-    occupancy_identifier_keys = ('OccupancyIdentifier', 'SubaddressIdentifier')
     street_type = parsed_addr.get(street_type_key)
     if street_type in ABNORMAL_OCCUPANCY_ABBRVS:
-        occupancy_type = None
-        occupancy = None
-        for key in occupany_type_keys:
-            try:
-                occupancy_type = parsed_addr[key]
-                break
-            except KeyError:
-                pass
-        for key in occupancy_identifier_keys:
-            try:
-                occupancy = parsed_addr[key]
-                occupancy_id_key = key
-                break
-            except KeyError:
-                break
+        occupancy_type = (
+            parsed_addr.get(occupany_type_key)
+            or parsed_addr.get('SubaddressType')
+        )
+        occupancy = parsed_addr.get(occupancy_id_key)
         if occupancy and not occupancy_type:
             if street_type in occupancy:
                 occupancy = occupancy.replace(street_type, '').strip()
@@ -433,9 +606,13 @@ def get_parsed_values(parsed_addr: OrderedDict, orig_val: str,
     :return: str | None
     """
     val_from_parse = parsed_addr.get(val_label)
-    orig_val = post_clean_addr_str(orig_val)
-    val_from_parse = post_clean_addr_str(val_from_parse)
-    non_null_val_set = {orig_val, val_from_parse} - {None}
+    # empty values are returned unchanged by post_clean_addr_str, so the
+    # call is skipped for them.
+    orig_val = post_clean_addr_str(orig_val) if orig_val else orig_val
+    if val_from_parse:
+        val_from_parse = post_clean_addr_str(val_from_parse)
+    non_null_val_set = {orig_val, val_from_parse}
+    non_null_val_set.discard(None)
     if len(non_null_val_set) > 1:
         msg = (
             f'Parsed {val_label} does not align with submitted value: '
@@ -458,9 +635,12 @@ def normalize_address_components(parsed_addr: OrderedDict,
     :return: parsed_addr with normalization processing applied to elements.
     :rtype: OrderedDict
     """
-    parsed_addr = normalize_numbered_streets(parsed_addr)
-    parsed_addr = normalize_directionals(parsed_addr, long_hand=long_hand)
-    parsed_addr = normalize_street_types(parsed_addr, long_hand=long_hand)
+    # numbered streets, directionals and street types are normalized in a
+    # single pass, dispatching on each component's label.
+    for tag in parsed_addr:
+        normalize_component = _TAG_HANDLERS.get(tag)
+        if normalize_component:
+            normalize_component(parsed_addr, tag, long_hand=long_hand)
     parsed_addr = normalize_occupancy_type(parsed_addr)
     return parsed_addr
 
@@ -472,19 +652,9 @@ def normalize_numbered_streets(parsed_addr: OrderedDict) -> OrderedDict:
     :type parsed_addr: Mapping
     :return: parsed_addr with ordinal identifiers appended to numbered streets.
     :rtype: dict"""
-    street_tags = ['StreetName', 'SecondStreetName']
-    for tag in street_tags:
-        post_type_tag = '{}PostType'.format(tag)
-        # limits updates to numbered street names that include a post street
-        # type, since an ordinal indicator would be inappropriate for some
-        # numbered streets (ie. Country Road 97).
-        if tag in parsed_addr.keys() and post_type_tag in parsed_addr.keys():
-            try:
-                cardinal = int(parsed_addr[tag])
-                ord_indicator = get_ordinal_indicator(cardinal)
-                parsed_addr[tag] = '{}{}'.format(cardinal, ord_indicator)
-            except ValueError:
-                pass
+    for tag in _POST_TYPE_TAGS:
+        if tag in parsed_addr:
+            _normalize_numbered_street(parsed_addr, tag)
     return parsed_addr
 
 
@@ -499,25 +669,9 @@ def normalize_directionals(parsed_addr: OrderedDict,
     :return: parsed_addr with directionals updated to abbreviated format.
     :rtype: dict
     """
-    # get the directional related keys from the current address.
-    found_directional_tags = (
-        tag for tag in parsed_addr.keys() if 'Directional' in tag
-    )
-    found_directional_tags = list(found_directional_tags)
-    for found in found_directional_tags:
-        # get the original directional related value per key.
-        dir_str = parsed_addr[found]
-        # remove spaces, punctuation, hyphens etc so two part directions
-        # conform to a single word standard. Convert to upper case
-        dir_str = clean_upper(
-            dir_str, exclude=[], removal_cats=STRIP_ALL_CATS, strip_spaces=True
-        )
-        if dir_str in DIRECTIONAL_REPLACEMENTS.keys():
-            dir_str = DIRECTIONAL_REPLACEMENTS[dir_str]
-        if long_hand:
-            dir_str = LONGHAND_DIRECTIONALS[dir_str]
-        parsed_addr[found] = dir_str
-
+    for tag in _DIRECTIONAL_TAGS:
+        if tag in parsed_addr:
+            _normalize_directional(parsed_addr, tag, long_hand=long_hand)
     return parsed_addr
 
 
@@ -535,20 +689,9 @@ def normalize_street_types(parsed_addr: OrderedDict,
     :return: parsed_addr with street types updated to abbreviated format.
     :rtype: dict
     """
-    # get the *Street*Type keys from the current parsed address.
-    found_type_tags = (
-        tag for tag in parsed_addr.keys() if 'Street' in tag and 'Type' in tag
-    )
-    for found in found_type_tags:
-        street_type = parsed_addr[found]
-        # lookup the appropriate abbrev for the street type found per key.
-        type_abbr = STREET_TYPE_ABBREVIATIONS.get(parsed_addr[found])
-        # update the street type only if a new abbreviation is found.
-        if type_abbr:
-            street_type = type_abbr
-        if long_hand:
-            street_type = LONGHAND_STREET_TYPES[street_type]
-        parsed_addr[found] = street_type
+    for tag in _STREET_TYPE_TAGS:
+        if tag in parsed_addr:
+            _normalize_street_type(parsed_addr, tag, long_hand=long_hand)
     return parsed_addr
 
 
@@ -582,20 +725,23 @@ def normalize_occupancy_type(parsed_addr: OrderedDict,
             and not occupancy_type_abbr):
         occupancy_type_abbr = default
     if occupancy_type_abbr:
-        parsed_list = list(parsed_addr.items())
-        try:
-            index = parsed_list.index(('OccupancyIdentifier', occupancy_id))
-        except ValueError:
+        if 'OccupancyIdentifier' not in parsed_addr:
             msg = (
                 'Address has an occupancy type (ie: Apt, Unit, etc) '
                 'but no occupancy identifier (ie: 101, A, etc)'
             )
             raise AddressNormalizationError(msg)
-        parsed_list.insert(index, (occupancy_type_label, occupancy_type_abbr))
-        parsed_addr = OrderedDict(parsed_list)
+        # insert the type immediately before the identifier in one pass.
+        normalized_addr = OrderedDict()
+        for key, value in parsed_addr.items():
+            if key == 'OccupancyIdentifier':
+                normalized_addr[occupancy_type_label] = occupancy_type_abbr
+            normalized_addr[key] = value
+        parsed_addr = normalized_addr
     return parsed_addr
 
 
+@lru_cache(maxsize=128)
 def normalize_state(state: str | None) -> str | None:
     """Change state string to accepted abbreviated format.
 
@@ -605,7 +751,7 @@ def normalize_state(state: str | None) -> str | None:
         in state names or standard long abbreviations.
     :rtype: str | None
     """
-    if state:
+    if state and state not in _STATE_CODES:
         state_abbrv = STATE_ABBREVIATIONS.get(state.upper())
         if state_abbrv:
             state = state_abbrv
@@ -626,15 +772,14 @@ def get_normalized_line_segment(parsed_addr: OrderedDict,
     """
 
     :param parsed_addr: address parsed into ordereddict per usaddress.
-    :param line_labels: tuple of str labels of all the potential keys related
+    :param line_labels: set of str labels of all the potential keys related
         to the desired address segment (ie address_line_1 or address_line_2).
     :return: s/r joined values from parsed_addr corresponding to given labels.
     """
-    line_elems = [
+    line_str = ' '.join([
         elem for key, elem in parsed_addr.items() if key in line_labels
-    ]
-    line_str = ' '.join(line_elems) if line_elems else None
-    return post_clean_addr_str(line_str)
+    ])
+    return post_clean_addr_str(line_str) if line_str else None
 
 
 def get_addr_line_str(addr_dict: dict, addr_parts: [str] = None,
@@ -669,12 +814,10 @@ def get_addr_line_str(addr_dict: dict, addr_parts: [str] = None,
 def format_address_record(address: dict) -> str:
     # type AddressRecord -> str
     """Format AddressRecord as string."""
-    address_template = Template('$address')
-    address = dict(address)
     addr_parts = [
         str(address[field]) for field in ADDRESS_KEYS if address.get(field)
     ]
-    return address_template.safe_substitute(address=', '.join(addr_parts))
+    return ', '.join(addr_parts)
 
 
 def get_geocoder_normalized_addr(address: dict | str,
@@ -691,22 +834,59 @@ def get_geocoder_normalized_addr(address: dict | str,
     if not isinstance(address, str):
         address_line_2 = address.get('address_line_2')
         address = get_addr_line_str(address, addr_parts=addr_keys)
-    geo_resp = geocoder.google(address)
-    if geo_resp.ok and geo_resp.housenumber:
-        line2 = geo_resp.subpremise or address_line_2
+    try:
+        geo_addr = _geocode_google(address)
+    except LookupError:
+        return geo_addr_dict
+    if geo_addr.housenumber:
+        line2 = geo_addr.subpremise or address_line_2
         geo_addr_dict = {
             'address_line_1':
-                ' '.join([geo_resp.housenumber, geo_resp.street]),
+                ' '.join([geo_addr.housenumber, geo_addr.street]),
             'address_line_2': strip_occupancy_type(line2),
-            'city': geo_resp.city,
-            'state': geo_resp.state,
-            'postal_code': geo_resp.postal
+            'city': geo_addr.city,
+            'state': geo_addr.state,
+            'postal_code': geo_addr.postal
         }
         for key, value in geo_addr_dict.items():
             geo_addr_dict[key] = value.upper() if value else None
     return geo_addr_dict
 
 
+def get_geocoder_normalized_addrs(addresses: Sequence[dict | str],
+                                  addr_keys: [str] = ADDRESS_KEYS,
+                                  max_workers: int = 8) -> list[dict]:
+    """Get geocoder normalized addresses for a batch of addresses.
+
+    Geocoder requests are network bound, so up to max_workers lookups are
+    made concurrently. Duplicate addresses are only geocoded once.
+
+    :param addresses: sequence of strings or dict-likes containing address
+        data
+    :param addr_keys: optional list of address keys. standard list of keys will
+        be used if not supplied
+    :param max_workers: maximum number of concurrent geocoder requests
+    :return: list of dicts containing geocoder address results, in the same
+        order as addresses
+    """
+    address_keys = (*addr_keys, 'address_line_2')
+    keys = [
+        address if isinstance(address, str)
+        else tuple(address.get(addr_key) for addr_key in address_keys)
+        for address in addresses
+    ]
+    unique_addrs = dict(zip(keys, addresses))
+
+    def geocode(address):
+        return get_geocoder_normalized_addr(address, addr_keys=addr_keys)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = dict(zip(
+            unique_addrs, executor.map(geocode, unique_addrs.values())
+        ))
+    return [dict(results[key]) for key in keys]
+
+
 def get_ordinal_indicator(number: int) -> str:
     """Get the ordinal indicator suffix applicable to the supplied number.
 
@@ -720,16 +900,7 @@ def get_ordinal_indicator(number: int) -> str:
     :return: ordinal indicator appropriate to the number supplied.
     :rtype: str
     """
-    str_num = str(number)
-    digits = len(str_num)
-    if str_num[-1] == '1' and not (digits >= 2 and str_num[-2:] == '11'):
-        return 'st'
-    elif str_num[-1] == '2' and not (digits >= 2 and str_num[-2:] == '12'):
-        return 'nd'
-    elif str_num[-1] == '3' and not (digits >= 2 and str_num[-2:] == '13'):
-        return 'rd'
-    else:
-        return 'th'
+    return _ORDINAL_INDICATORS[abs(number) % 100]
 
 
 class NormalizeAddress(object):
@@ -872,9 +1043,7 @@ class NormalizeAddress(object):
             return addr_rec
 
     def normalize_addr_dict(self):
-        addr_dict = validate_address_components(
-            self.address, strict=self.strict
-        )
+        addr_dict = validate_address_components(self.address, self.strict)
 
         # line 1 and line 2 elements are combined to ensure consistent
         # processing whether the line 2 elements are pre-parsed or
@@ -905,3 +1074,6 @@ class NormalizeAddress(object):
         return self.get_parsed_values(
             parsed_addr, city, 'PlaceName', addr_str
         )
+
+
+register_refresh_hook(_refresh_constant_lookups)
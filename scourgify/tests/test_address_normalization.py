@@ -9,18 +9,18 @@ Unit tests for scourgify.
 
 # Imports from Standard Library
 from collections import OrderedDict
-from unittest import TestCase, mock
-
-# Imports from Third Party Modules
-from yamlconf import ConfigError
+from dataclasses import dataclass
+from types import SimpleNamespace
+from unittest import TestCase, mock, skipIf
 
 # Local Imports
-from scourgify import address_constants
+from scourgify import address_constants, normalize
 from scourgify.cleaning import (
     clean_ambiguous_street_types,
     clean_period_char,
     post_clean_addr_str,
     pre_clean_addr_str,
+    strip_occupancy_type,
 )
 from scourgify.exceptions import (
     AddressNormalizationError,
@@ -30,8 +30,10 @@ from scourgify.exceptions import (
     UnParseableAddressError,
 )
 from scourgify.normalize import (
+    _geocode_google,
     get_addr_line_str,
     get_geocoder_normalized_addr,
+    get_geocoder_normalized_addrs,
     get_normalized_line_segment,
     get_ordinal_indicator,
     get_parsed_values,
@@ -50,28 +52,73 @@ from scourgify.validations import (
     validate_address_components,
     validate_parens_groups_parsed,
     validate_us_postal_code_format,
+    validate_us_postal_codes,
 )
 
 # Constants
 SERVICE = 'GBR Test Normalization'
+OCCUPANCY_ADDR_MAP = {
+    'address_line_1': 'address1',
+    'address_line_2': 'address2',
+    'city': 'city',
+    'state': 'state',
+    'postal_code': 'zip'
+}
+ORDINAL_CASES = (
+    (11, 'th'), (112, 'th'), (3113, 'th'), (1, 'st'), (22, 'nd'),
+    (31243, 'rd'),
+)
+INVALID_POSTAL_CODES = (
+    'AAAAA', '97219-AAAA', '97219-000100', '97219-0001-00', '9721900',
+    '3 -4', '97219 - 0001',
+)
+VALID_POSTAL_CODES = (
+    ('972', '00972'),
+    ('97219-00', '97219-0000'),
+    ('972-0001', '00972-0001'),
+    ('972190001', '97219-0001'),
+    ('97219', '97219'),
+    (97009, '97009'),
+    (2129, '02129'),
+)
 # Helper Functions & Classes
 
 
+def addtl_test_func(addr_str):
+    if 'BLDG A1' in addr_str:
+        return '123 NOWHERE STREET', 'BLDG A1 RIGHT'
+    else:
+        raise ValueError
+
+
+ADDTL_FUNCS = (addtl_test_func,)
+
+
+@dataclass
+class UnhashableTestFunc:
+    """Callable addtl_funcs object; dataclasses with eq are unhashable."""
+    line2: str = 'BLDG A1 RIGHT'
+
+    def __call__(self, addr_str):
+        return addtl_test_func(addr_str)
+
+
 # Tests
 class TestAddressNormalization(TestCase):
     """Unit tests for scourgify"""
     # pylint:disable=too-many-arguments
 
-    def setUp(self):
-        """setUp"""
-        self.expected = dict(
+    @classmethod
+    def setUpClass(cls):
+        """setUpClass"""
+        cls.expected = dict(
             address_line_1='123 NOWHERE ST',
             address_line_2='STE 0',
             city='BORING',
             state='OR',
             postal_code='97009'
         )
-        self.address_dict = dict(
+        cls.address_dict = dict(
             address_line_1='123 Nowhere St',
             address_line_2='Suite 0',
             city='Boring',
@@ -79,55 +126,55 @@ class TestAddressNormalization(TestCase):
             postal_code='97009'
         )
 
-        self.ordinal_addr = dict(
+        cls.ordinal_addr = dict(
             address_line_1='4333 NE 113th',
             city='Boring',
             state='OR',
             postal_code='97009'
         )
-        self.ordinal_expected = dict(
+        cls.ordinal_expected = dict(
             address_line_1='4333 NE 113TH',
             address_line_2=None,
             city='BORING',
             state='OR',
             postal_code='97009'
         )
-        self.parseable_addr_str = '123 Nowhere Street Suite 0 Boring OR 97009'
-        self.parsed_addr = OrderedDict([
-            ('AddressNumber', '123'),
-            ('StreetName', 'NOWHERE'),
-            ('StreetNamePostType', 'STREET'),
-            ('OccupancyType', 'SUITE'),
-            ('OccupancyIdentifier', '0'),
-            ('PlaceName', 'BORING'),
-            ('StateName', 'OR'),
-            ('ZipCode', '97009')
-        ])
-        self.hash_tag = '999 Nowhere Street # 12 Boring OR 97009'
-        self.hash_expected = dict(
+        cls.parseable_addr_str = '123 Nowhere Street Suite 0 Boring OR 97009'
+        cls.parsed_addr = {
+            'AddressNumber': '123',
+            'StreetName': 'NOWHERE',
+            'StreetNamePostType': 'STREET',
+            'OccupancyType': 'SUITE',
+            'OccupancyIdentifier': '0',
+            'PlaceName': 'BORING',
+            'StateName': 'OR',
+            'ZipCode': '97009'
+        }
+        cls.hash_tag = '999 Nowhere Street # 12 Boring OR 97009'
+        cls.hash_expected = dict(
             address_line_1='999 NOWHERE ST',
             address_line_2='# 12',
             city='BORING',
             state='OR',
             postal_code='97009'
         )
-        self.unparesable_addr_str = '6000 SW 1000TH AVE  (BLDG  A5 RIGHT)'
+        cls.unparesable_addr_str = '6000 SW 1000TH AVE  (BLDG  A5 RIGHT)'
 
-        self.direction_expected = dict(
+        cls.direction_expected = dict(
             address_line_1='123 SW NOWHERE ST',
             address_line_2='STE 0',
             city='BORING',
             state='OR',
             postal_code='97009'
         )
-        self.long_hand_expected = dict(
+        cls.long_hand_expected = dict(
             address_line_1='123 SOUTHWEST NOWHERE STREET',
             address_line_2='STE 0',
             city='BORING',
             state='OR',
             postal_code='97009'
         )
-        self.abnormal_direction = dict(
+        cls.abnormal_direction = dict(
             address_line_1='123 South-West Nowhere St',
             address_line_2='Suite 0',
             city='Boring',
@@ -138,51 +185,51 @@ class TestAddressNormalization(TestCase):
     def test_normalize_address_record(self):
         """Test normalize_address_record function."""
         result = normalize_address_record(self.parseable_addr_str)
-        self.assertDictEqual(self.expected, result)
+        self.assertEqual(self.expected, result)
 
         result = normalize_address_record(self.address_dict)
-        self.assertDictEqual(self.expected, result)
+        self.assertEqual(self.expected, result)
 
         result = normalize_address_record(self.ordinal_addr)
-        self.assertDictEqual(self.ordinal_expected, result)
+        self.assertEqual(self.ordinal_expected, result)
 
         result = normalize_address_record(self.hash_tag)
-        self.assertDictEqual(self.hash_expected, result)
+        self.assertEqual(self.hash_expected, result)
 
         result = normalize_address_record(self.abnormal_direction)
-        self.assertDictEqual(self.direction_expected, result)
+        self.assertEqual(self.direction_expected, result)
 
         result = normalize_address_record(
             self.abnormal_direction, long_hand=True
         )
-        self.assertDictEqual(self.long_hand_expected, result)
+        self.assertEqual(self.long_hand_expected, result)
 
     def test_normalize_class(self):
         """Test normalize_address_record function."""
         result = NormalizeAddress(self.parseable_addr_str).normalize()
-        self.assertDictEqual(self.expected, result)
+        self.assertEqual(self.expected, result)
 
         result = NormalizeAddress(self.address_dict).normalize()
-        self.assertDictEqual(self.expected, result)
+        self.assertEqual(self.expected, result)
 
         result = NormalizeAddress(self.ordinal_addr).normalize()
-        self.assertDictEqual(self.ordinal_expected, result)
+        self.assertEqual(self.ordinal_expected, result)
 
         result = NormalizeAddress(self.hash_tag).normalize()
-        self.assertDictEqual(self.hash_expected, result)
+        self.assertEqual(self.hash_expected, result)
 
         result = NormalizeAddress(self.abnormal_direction).normalize()
-        self.assertDictEqual(self.direction_expected, result)
+        self.assertEqual(self.direction_expected, result)
 
         result = NormalizeAddress(
             self.abnormal_direction, long_hand=True
         ).normalize()
-        self.assertDictEqual(self.long_hand_expected, result)
+        self.assertEqual(self.long_hand_expected, result)
 
     def test_normalize_addr_str(self):
         """Test normalize_addr_str function."""
         result = normalize_addr_str(self.parseable_addr_str)
-        self.assertDictEqual(self.expected, result)
+        self.assertEqual(self.expected, result)
 
         broken_line1 = '6000 SW 1000TH AVE '
         broken_line2 = '(BLDG  A1 RIGHT)'
@@ -196,13 +243,7 @@ class TestAddressNormalization(TestCase):
             'state': 'OR', 'city': 'PORTLAND',
             'postal_code': '97203'
         }
-        self.assertDictEqual(expected, result)
-
-        def addtl_test_func(addr_str):
-            if 'BLDG A1' in addr_str:
-                return '123 NOWHERE STREET', 'BLDG A1 RIGHT'
-            else:
-                raise ValueError
+        self.assertEqual(expected, result)
 
         addtl_processing = '123 Nowhere Street (BLDG A1 RIGHT)'
         expected = {
@@ -213,23 +254,44 @@ class TestAddressNormalization(TestCase):
         }
         result = normalize_addr_str(
             addtl_processing, city='Portland', state='OR', zipcode='97203',
-            addtl_funcs=[addtl_test_func]
+            addtl_funcs=ADDTL_FUNCS
         )
-        self.assertDictEqual(expected, result)
+        self.assertEqual(expected, result)
 
         self.assertRaises(
             UnParseableAddressError,
             normalize_addr_str,
             self.unparesable_addr_str,
             city='Portland', state='OR', zipcode='97203',
-            addtl_funcs=[addtl_test_func]
+            addtl_funcs=ADDTL_FUNCS
 
         )
 
+    def test_normalize_addr_str_unhashable_addtl_funcs(self):
+        """Test normalize_addr_str accepts unhashable addtl_funcs."""
+        expected = {
+            'address_line_1': '123 NOWHERE ST',
+            'address_line_2': 'BLDG A1 RIGHT',
+            'state': 'OR', 'city': 'PORTLAND',
+            'postal_code': '97203'
+        }
+        result = normalize_addr_str(
+            '123 Nowhere Street (BLDG A1 RIGHT)', city='Portland',
+            state='OR', zipcode='97203', addtl_funcs=[UnhashableTestFunc()]
+        )
+        self.assertEqual(expected, result)
+
+    def test_normalize_addr_str_returns_copies(self):
+        """Test cached normalize_addr_str results are not shared."""
+        result = normalize_addr_str(self.parseable_addr_str)
+        result['city'] = 'NOWHERE'
+        result = normalize_addr_str(self.parseable_addr_str)
+        self.assertEqual(self.expected, result)
+
     def test_normalize_addr_dict(self):
         """Test normalize_addr_dict function."""
         result = normalize_addr_dict(self.address_dict)
-        self.assertDictEqual(self.expected, result)
+        self.assertEqual(self.expected, result)
 
         alternate_dict = dict(
             address1='123 Nowhere St',
@@ -246,12 +308,16 @@ class TestAddressNormalization(TestCase):
             'postal_code': 'zip'
         }
         result = normalize_addr_dict(alternate_dict, addr_map=dict_map)
-        self.assertDictEqual(self.expected, result)
+        self.assertEqual(self.expected, result)
 
     def test_parse_address_string(self):
         """Test parse_address_string function."""
         result = parse_address_string(self.parseable_addr_str)
-        self.assertIsInstance(result, OrderedDict)
+        self.assertIs(type(result), OrderedDict)
+
+        result['StreetName'] = 'NOWHERE'
+        result = parse_address_string(self.parseable_addr_str)
+        self.assertNotEqual(result['StreetName'], 'NOWHERE')
 
         ambig_addr_str = 'AWBREY VILLAGE'
         with self.assertRaises(AmbiguousAddressError):
@@ -264,125 +330,68 @@ class TestAddressNormalization(TestCase):
         in an address validation service also allowing the address to pass
         through even though no unit should have existed on the home.
         """
-        dict_map = {
-            'address_line_1': 'address1',
-            'address_line_2': 'address2',
-            'city': 'city',
-            'state': 'state',
-            'postal_code': 'zip'
-        }
-
-        weird_unit = dict(
-            address1='123 Nowhere St',
-            address2='Ave 345',
-            city='Boring',
-            state='OR',
-            zip='97009'
-        )
-        expected = dict(
-            address_line_1='123 NOWHERE ST',
-            address_line_2='UNIT 345',
-            city='BORING',
-            state='OR',
-            postal_code='97009'
-        )
-        result = normalize_addr_dict(weird_unit, addr_map=dict_map)
-        self.assertDictEqual(expected, result)
-
-        late_unit_add = dict(
-            address1='123 Nowhere St',
-            address2='345',
-            city='Boring',
-            state='OR',
-            zip='97009'
-        )
-        result = normalize_addr_dict(late_unit_add, addr_map=dict_map)
-        self.assertDictEqual(expected, result)
-
-        expected = dict(
-            address_line_1='123 NOWHERE ST',
-            address_line_2='# 345',
-            city='BORING',
-            state='OR',
-            postal_code='97009'
-        )
-
-        hashtag_unit = dict(
-            address1='123 Nowhere St',
-            address2='# 345',
-            city='Boring',
-            state='OR',
-            zip='97009'
-        )
-        result = normalize_addr_dict(hashtag_unit, addr_map=dict_map)
-        self.assertDictEqual(expected, result)
-
-        hashtag_unit = dict(
+        address = dict(
             address1='123 Nowhere St',
-            address2='#345',
             city='Boring',
             state='OR',
             zip='97009'
         )
-        result = normalize_addr_dict(hashtag_unit, addr_map=dict_map)
-        self.assertDictEqual(expected, result)
-
         expected = dict(
             address_line_1='123 NOWHERE ST',
-            address_line_2='APT 345',
             city='BORING',
             state='OR',
             postal_code='97009'
         )
-
-        abbreviation = dict(
-            address1='123 Nowhere St',
-            address2='Apt 345',
-            city='Boring',
-            state='OR',
-            zip='97009'
-        )
-        result = normalize_addr_dict(abbreviation, addr_map=dict_map)
-        self.assertDictEqual(expected, result)
-
-        full_name = dict(
-            address1='123 Nowhere St',
-            address2='Apartment 345',
-            city='Boring',
-            state='OR',
-            zip='97009'
-        )
-        result = normalize_addr_dict(full_name, addr_map=dict_map)
-        self.assertDictEqual(expected, result)
+        cases = (
+            ('weird_unit', 'Ave 345', 'UNIT 345'),
+            ('late_unit_add', '345', 'UNIT 345'),
+            ('hashtag_unit', '# 345', '# 345'),
+            ('hashtag_unit_no_space', '#345', '# 345'),
+            ('abbreviation', 'Apt 345', 'APT 345'),
+            ('full_name', 'Apartment 345', 'APT 345'),
+        )
+        for name, address2, address_line_2 in cases:
+            with self.subTest(name):
+                result = normalize_addr_dict(
+                    {**address, 'address2': address2},
+                    addr_map=OCCUPANCY_ADDR_MAP
+                )
+                self.assertEqual(
+                    {**expected, 'address_line_2': address_line_2}, result
+                )
 
 
 class TestAddressNormalizationUtils(TestCase):
     """Unit tests for scourgify utils"""
+    GEO_ADDR = SimpleNamespace(
+        ok=True, housenumber='1234', street='Main', subpremise='',
+        city='Boring', state='OR', postal='97000'
+    )
 
-    def setUp(self):
-
-        self.address_dict = dict(
+    @classmethod
+    def setUpClass(cls):
+        cls.address_dict = dict(
             address_line_1='123 Nowhere St',
             address_line_2='Suite 0',
             city='Boring',
             state='OR',
             postal_code='97009'
         )
-        self.parseable_addr = '123 Nowhere Street Suite 0 Boring OR 97009'
-        self.parsed_addr = OrderedDict([
-            ('AddressNumber', '123'),
-            ('StreetName', 'NOWHERE'),
-            ('StreetNamePostType', 'STREET'),
-            ('OccupancyType', 'SUITE'),
-            ('OccupancyIdentifier', '0'),
-            ('PlaceName', 'BORING'),
-            ('StateName', 'OR'),
-            ('ZipCode', '97009')
-        ])
+        cls.parseable_addr = '123 Nowhere Street Suite 0 Boring OR 97009'
+        cls.parsed_addr = {
+            'AddressNumber': '123',
+            'StreetName': 'NOWHERE',
+            'StreetNamePostType': 'STREET',
+            'OccupancyType': 'SUITE',
+            'OccupancyIdentifier': '0',
+            'PlaceName': 'BORING',
+            'StateName': 'OR',
+            'ZipCode': '97009'
+        }
 
-        self.unparesable_addr = '6000 SW 1000TH AVE  (BLDG  A1 RIGHT)'
+        cls.unparesable_addr = '6000 SW 1000TH AVE  (BLDG  A1 RIGHT)'
 
-        self.unparesable_addr_dict = OrderedDict([
+        cls.unparesable_addr_dict = OrderedDict([
             ('AddressNumber', '6000'),
             ('StreetNamePreDirectional', 'SW'),
             ('StreetName', '1000TH'),
@@ -430,21 +439,21 @@ class TestAddressNormalizationUtils(TestCase):
 
     def test_normalize_numbered_streets(self):
         """Test normalize_numbered_streets function."""
-        numbered_addr = OrderedDict([
-            ('AddressNumber', '123'),
-            ('StreetName', '100'),
-            ('StreetNamePostType', 'STREET')
-        ])
-        county_road = OrderedDict([
-            ('AddressNumber', '123'),
-            ('StreetNamePreType', 'COUNTY ROAD'),
-            ('StreetName', '100')
-        ])
-        string_addr = OrderedDict([
-            ('AddressNumber', '123'),
-            ('StreetName', '91st'),
-            ('StreetNamePostType', 'STREET')
-        ])
+        numbered_addr = {
+            'AddressNumber': '123',
+            'StreetName': '100',
+            'StreetNamePostType': 'STREET'
+        }
+        county_road = {
+            'AddressNumber': '123',
+            'StreetNamePreType': 'COUNTY ROAD',
+            'StreetName': '100'
+        }
+        string_addr = {
+            'AddressNumber': '123',
+            'StreetName': '91st',
+            'StreetNamePostType': 'STREET'
+        }
 
         expected = '{}{}'.format(
             numbered_addr['StreetName'], 'th'
@@ -453,40 +462,40 @@ class TestAddressNormalizationUtils(TestCase):
         self.assertEqual(expected, result['StreetName'])
 
         result = normalize_numbered_streets(county_road)
-        self.assertDictEqual(county_road, result)
+        self.assertEqual(county_road, result)
 
         result = normalize_numbered_streets(string_addr)
-        self.assertDictEqual(string_addr, result)
+        self.assertEqual(string_addr, result)
 
     def test_normalize_directionals(self):
         """Test normalize_directionals function."""
-        unabbr_directional = OrderedDict([
-            ('AddressNumber', '123'),
-            ('StreetNamePreDirectional', 'South West', ),
-            ('StreetName', '100'),
-            ('StreetNamePostType', 'STREET')
-        ])
-        abbrev_directional = OrderedDict([
-            ('AddressNumber', '123'),
-            ('StreetNamePreDirectional', 'SW'),
-            ('StreetNamePreType', 'COUNTY ROAD'),
-            ('StreetName', '100')
-        ])
-        no_directional = OrderedDict([
-            ('AddressNumber', '123'),
-            ('StreetName', '91st'),
-            ('StreetNamePostType', 'STREET')
-        ])
+        unabbr_directional = {
+            'AddressNumber': '123',
+            'StreetNamePreDirectional': 'South West',
+            'StreetName': '100',
+            'StreetNamePostType': 'STREET'
+        }
+        abbrev_directional = {
+            'AddressNumber': '123',
+            'StreetNamePreDirectional': 'SW',
+            'StreetNamePreType': 'COUNTY ROAD',
+            'StreetName': '100'
+        }
+        no_directional = {
+            'AddressNumber': '123',
+            'StreetName': '91st',
+            'StreetNamePostType': 'STREET'
+        }
 
         expected = 'SW'
         result = normalize_directionals(unabbr_directional)
         self.assertEqual(expected, result['StreetNamePreDirectional'])
 
         result = normalize_directionals(abbrev_directional)
-        self.assertDictEqual(abbrev_directional, result)
+        self.assertEqual(abbrev_directional, result)
 
         result = normalize_directionals(no_directional)
-        self.assertDictEqual(no_directional, result)
+        self.assertEqual(no_directional, result)
 
         expected = 'SOUTHWEST'
         result = normalize_directionals(abbrev_directional, long_hand=True)
@@ -494,42 +503,42 @@ class TestAddressNormalizationUtils(TestCase):
 
     def test_normalize_street_types(self):
         """Test normalize_street_types function."""
-        unabbr_type = OrderedDict([
-            ('AddressNumber', '123'),
-            ('StreetNamePreDirectional', 'SW', ),
-            ('StreetName', 'MAIN'),
-            ('StreetNamePostType', 'STREET')
-        ])
-        abbrev_type = OrderedDict([
-            ('AddressNumber', '123'),
-            ('StreetNamePreDirectional', 'SW', ),
-            ('StreetName', 'MAIN'),
-            ('StreetNamePostType', 'AVE')
-        ])
-        typo_type = OrderedDict([
-            ('AddressNumber', '123'),
-            ('StreetNamePreDirectional', 'SW', ),
-            ('StreetName', 'MAIN'),
-            ('StreetNamePostType', 'STROET')
-        ])
-        no_type = OrderedDict([
-            ('AddressNumber', '123'),
-            ('StreetNamePreDirectional', 'SW', ),
-            ('StreetName', 'MAIN'),
-        ])
+        unabbr_type = {
+            'AddressNumber': '123',
+            'StreetNamePreDirectional': 'SW',
+            'StreetName': 'MAIN',
+            'StreetNamePostType': 'STREET'
+        }
+        abbrev_type = {
+            'AddressNumber': '123',
+            'StreetNamePreDirectional': 'SW',
+            'StreetName': 'MAIN',
+            'StreetNamePostType': 'AVE'
+        }
+        typo_type = {
+            'AddressNumber': '123',
+            'StreetNamePreDirectional': 'SW',
+            'StreetName': 'MAIN',
+            'StreetNamePostType': 'STROET'
+        }
+        no_type = {
+            'AddressNumber': '123',
+            'StreetNamePreDirectional': 'SW',
+            'StreetName': 'MAIN'
+        }
 
         expected = 'ST'
         result = normalize_street_types(unabbr_type)
         self.assertEqual(expected, result['StreetNamePostType'])
 
         result = normalize_street_types(abbrev_type)
-        self.assertDictEqual(abbrev_type, result)
+        self.assertEqual(abbrev_type, result)
 
         result = normalize_street_types(typo_type)
-        self.assertDictEqual(typo_type, result)
+        self.assertEqual(typo_type, result)
 
         result = normalize_street_types(no_type)
-        self.assertDictEqual(no_type, result)
+        self.assertEqual(no_type, result)
 
         expected = 'AVENUE'
         result = normalize_street_types(abbrev_type, long_hand=True)
@@ -538,8 +547,21 @@ class TestAddressNormalizationUtils(TestCase):
     def test_normalize_occupancy_type(self):
         """Test normalize_occupancy_type function."""
         expected = 'STE'
-        result = normalize_occupancy_type(self.parsed_addr)
+        # normalize_occupancy_type updates parsed_addr in place.
+        result = normalize_occupancy_type(dict(self.parsed_addr))
         self.assertEqual(expected, result['OccupancyType'])
+        keys = list(result.keys())
+        self.assertEqual(
+            keys.index('OccupancyType') + 1, keys.index('OccupancyIdentifier')
+        )
+
+        no_identifier = {
+            'AddressNumber': '123',
+            'StreetName': 'NOWHERE',
+            'OccupancyType': 'SUITE'
+        }
+        with self.assertRaises(AddressNormalizationError):
+            normalize_occupancy_type(no_identifier)
 
     def test_normalize_state(self):
         """Test normalize_state function"""
@@ -564,6 +586,11 @@ class TestAddressNormalizationUtils(TestCase):
         result = pre_clean_addr_str(odd_addr)
         self.assertEqual(expected, result)
 
+        oddity_addr = '123 Nowhere St developed by HOST, UN 5'
+        expected = '123 NOWHERE ST UNIT 5'
+        result = pre_clean_addr_str(oddity_addr)
+        self.assertEqual(expected, result)
+
     def test_post_clean_addr_str(self):
         """Test post_clean_addr_str function."""
         addr_str = '(100-104) SW NO   WHERE st'
@@ -623,50 +650,50 @@ class TestAddressNormalizationUtils(TestCase):
 
     def test_validate_postal_code(self):
         """Test validate_us_postal_code_format"""
-
-        with self.assertRaises(AddressValidationError):
-            zip_five = 'AAAAA'
-            validate_us_postal_code_format(zip_five, self.address_dict)
-
-        with self.assertRaises(AddressValidationError):
-            zip_five = '97219-AAAA'
-            validate_us_postal_code_format(zip_five, self.address_dict)
-
-        with self.assertRaises(AddressValidationError):
-            zip_plus = '97219-000100'
-            validate_us_postal_code_format(zip_plus, self.address_dict)
-
-        with self.assertRaises(AddressValidationError):
-            zip_plus = '97219-0001-00'
-            validate_us_postal_code_format(zip_plus, self.address_dict)
-
-        with self.assertRaises(AddressValidationError):
-            zip_five = '9721900'
-            validate_us_postal_code_format(zip_five, self.address_dict)
-
-        zip_five = '972'
-        expected = '00972'
-        result = validate_us_postal_code_format(zip_five, self.address_dict)
-        self.assertEqual(expected, result)
-
-        zip_plus = '97219-00'
-        expected = '97219-0000'
-        result = validate_us_postal_code_format(zip_plus, self.address_dict)
-        self.assertEqual(expected, result)
-
-        zip_plus = '972-0001'
-        expected = '00972-0001'
-        result = validate_us_postal_code_format(zip_plus, self.address_dict)
-        self.assertEqual(expected, result)
-
-        zip_plus = '972190001'
-        expected = '97219-0001'
-        result = validate_us_postal_code_format(zip_plus, self.address_dict)
-        self.assertEqual(expected, result)
-
-        expected = '97219'
-        result = validate_us_postal_code_format(expected, self.address_dict)
-        self.assertEqual(expected, result)
+        for postal_code in INVALID_POSTAL_CODES:
+            with self.subTest(postal_code=postal_code):
+                with self.assertRaises(AddressValidationError):
+                    validate_us_postal_code_format(
+                        postal_code, self.address_dict
+                    )
+
+        for postal_code, expected in VALID_POSTAL_CODES:
+            with self.subTest(postal_code=postal_code):
+                result = validate_us_postal_code_format(
+                    postal_code, self.address_dict
+                )
+                self.assertEqual(expected, result)
+                if isinstance(postal_code, str):
+                    result = validate_us_postal_code_format(
+                        postal_code, self.address_dict, pre_cleaned=True
+                    )
+                    self.assertEqual(expected, result)
+
+    def test_validate_postal_codes(self):
+        """Test validate_us_postal_codes"""
+        postal_codes = [code for code, _ in VALID_POSTAL_CODES]
+        expected = [result for _, result in VALID_POSTAL_CODES]
+        result = validate_us_postal_codes(postal_codes + postal_codes)
+        self.assertEqual(expected + expected, result)
+
+        # invalid codes are returned as None, rather than failing the batch
+        result = validate_us_postal_codes(
+            INVALID_POSTAL_CODES + tuple(postal_codes)
+        )
+        self.assertEqual([None] * len(INVALID_POSTAL_CODES) + expected, result)
+
+        # equal codes of different types are normalized independently
+        mixed_type_cases = (
+            ([97009.0], [None]),
+            ([97009, 97009.0], ['97009', None]),
+            ([97009.0, 97009], [None, '97009']),
+            ([97009, '97009'], ['97009', '97009']),
+        )
+        for postal_codes, expected in mixed_type_cases:
+            with self.subTest(postal_codes=postal_codes):
+                self.assertEqual(
+                    expected, validate_us_postal_codes(postal_codes)
+                )
 
     def test_get_addr_line_str(self):
         """Test get_addr_line_str function."""
@@ -695,22 +722,10 @@ class TestAddressNormalizationUtils(TestCase):
         with self.assertRaises(TypeError):
             get_addr_line_str(self.address_dict, addr_parts='line1')
 
-    @mock.patch(
-        'scourgify.normalize.geocoder'
-    )
-    def test_get_geocoder_normalized_addr(self, mock_geocoder):
+    @skipIf(not address_constants.CACHE_SIZE, 'memoization is disabled')
+    def test_get_geocoder_normalized_addr(self):
         """Test get_geocoder_normalized_addr"""
-        geo_addr = mock.MagicMock()
-        geo_addr.ok = True
-        geo_addr.housenumber = '1234'
-        geo_addr.street = "Main"
-        geo_addr.subpremise = ''
-        geo_addr.city = 'Boring'
-        geo_addr.state = 'OR'
-        geo_addr.postal = '97000'
-
-        mock_geocoder.google.return_value = geo_addr
-
+        _geocode_google.cache_clear()
         address = {
             'address_line_1': '1234 Main',
             'address_line_2': None,
@@ -719,32 +734,55 @@ class TestAddressNormalizationUtils(TestCase):
             'postal_code': '97000'
         }
         addr_str_return_value = "1234 Main Boring OR 97000"
-        get_geocoder_normalized_addr(address)
-        mock_geocoder.google.assert_called_with(addr_str_return_value)
+        with mock.patch.object(normalize, 'geocoder') as mock_geocoder:
+            mock_geocoder.google.return_value = self.GEO_ADDR
+            get_geocoder_normalized_addr(address)
+            mock_geocoder.google.assert_called_with(addr_str_return_value)
+            # only the address fields of the response are cached
+            self.assertEqual(
+                ('1234', 'Main', '', 'Boring', 'OR', '97000'),
+                _geocode_google(addr_str_return_value)
+            )
+
+            get_geocoder_normalized_addr(address)
+            self.assertEqual(mock_geocoder.google.call_count, 1)
+
+            mock_geocoder.google.return_value = SimpleNamespace(ok=False)
+            _geocode_google.cache_clear()
+            self.assertEqual(get_geocoder_normalized_addr(address), {})
+            self.assertEqual(get_geocoder_normalized_addr(address), {})
+            self.assertEqual(mock_geocoder.google.call_count, 3)
+
+    def test_get_geocoder_normalized_addrs(self):
+        """Test get_geocoder_normalized_addrs"""
+        _geocode_google.cache_clear()
+        address = {
+            'address_line_1': '1234 Main',
+            'city': 'Boring',
+            'state': 'OR',
+            'postal_code': '97000'
+        }
+        expected = {
+            'address_line_1': '1234 MAIN',
+            'address_line_2': None,
+            'city': 'BORING',
+            'state': 'OR',
+            'postal_code': '97000'
+        }
+        with mock.patch.object(normalize, 'geocoder') as mock_geocoder:
+            mock_geocoder.google.return_value = self.GEO_ADDR
+            result = get_geocoder_normalized_addrs([address, dict(address)])
+            mock_geocoder.google.assert_called_once_with(
+                '1234 Main Boring OR 97000'
+            )
+        self.assertEqual(result, [expected, expected])
+        self.assertIsNot(result[0], result[1])
 
     def test_get_ordinal_indicator(self):
         """Test get_ordinal_indicator"""
-        result = get_ordinal_indicator(11)
-        expected = 'th'
-        self.assertEqual(expected, result)
-
-        result = get_ordinal_indicator(112)
-        self.assertEqual(expected, result)
-
-        result = get_ordinal_indicator(3113)
-        self.assertEqual(expected, result)
-
-        result = get_ordinal_indicator(1)
-        expected = 'st'
-        self.assertEqual(expected, result)
-
-        result = get_ordinal_indicator(22)
-        expected = 'nd'
-        self.assertEqual(expected, result)
-
-        result = get_ordinal_indicator(31243)
-        expected = 'rd'
-        self.assertEqual(expected, result)
+        for number, expected in ORDINAL_CASES:
+            with self.subTest(number=number):
+                self.assertEqual(expected, get_ordinal_indicator(number))
 
     def test_clean_period_char(self):
         """Test clean_period_char"""
@@ -759,9 +797,16 @@ class TestAddressNormalizationUtils(TestCase):
         result = validate_parens_groups_parsed(broken_line1)
         self.assertEqual(broken_line1, result)
 
-        bad_addr = '10000 NE 8TH (ROW HOUSE)'
-        with self.assertRaises(AmbiguousAddressError):
-            validate_parens_groups_parsed(bad_addr)
+        for line1 in ('10000 NE 8TH (ROW HOUSE)', '10000 NE 8TH ((A)'):
+            with self.subTest(line1=line1):
+                with self.assertRaises(AmbiguousAddressError):
+                    validate_parens_groups_parsed(line1)
+
+        # empty or unclosed parens are not parenthesis groups
+        for line1 in ('10000 NE 8TH ()', '10000 NE 8TH ) (A'):
+            with self.subTest(line1=line1):
+                result = validate_parens_groups_parsed(line1)
+                self.assertEqual(line1, result)
 
     def test_clean_ambiguous_street_types(self):
         """ Test clean_ambiguous_street_types"""
@@ -774,6 +819,11 @@ class TestAddressNormalizationUtils(TestCase):
         result = clean_ambiguous_street_types(normal_addr)
         self.assertEqual(normal_addr, result)
 
+        intersection_addr = "BROKEN CT & OTHER CT"
+        expected = "BROKEN COURT & OTHER COURT"
+        result = clean_ambiguous_street_types(intersection_addr)
+        self.assertEqual(expected, result)
+
     def test_address_normalization_error(self):
         error_msg = 'Error Message'
         error_title = 'ERROR TITLE'
@@ -782,41 +832,113 @@ class TestAddressNormalizationUtils(TestCase):
         error = AddressNormalizationError(error_msg, error_title, addtl_args)
         self.assertEqual(expected, str(error))
 
+        # the message reflects changes to error and title after formatting
+        error.error = 'New Message'
+        expected = "{}: {}, {}".format(error_title, 'New Message', addtl_args)
+        self.assertEqual(expected, str(error))
+
     @mock.patch.object(address_constants.NormalizationConfig, 'get')
     def test_set_constants(self, mock_config_get):
         new_addr_keys = ['new keys']
         new_problem_st = {
             "PS": 'STREET'
         }
-        mock_config_get.side_effect = (
-            'update', new_addr_keys,
+        # config.get is called for insertion_method, ADDRESS_KEYS and then
+        # each of the address constants in turn.
+        config_values = (
+            new_addr_keys,
             None, None, None, None, None,
             new_problem_st, None, None,
         )
+
+        def _side_effect(mode):
+            return (mode,) + config_values
+
+        mock_config_get.side_effect = _side_effect('update')
         address_constants.set_address_constants()
         self.assertEqual(address_constants.ADDRESS_KEYS, new_addr_keys)
         self.assertIn("PS", address_constants.PROBLEM_ST_TYPE_ABBRVS.keys())
 
-        mock_config_get.side_effect = (
-            'replace', new_addr_keys,
-            None, None, None, None, None,
-            new_problem_st, None, None,
-        )
+        mock_config_get.side_effect = _side_effect('replace')
         address_constants.set_address_constants()
         self.assertEqual(address_constants.ADDRESS_KEYS, new_addr_keys)
-        self.assertDictEqual(
+        self.assertEqual(
             new_problem_st, address_constants.PROBLEM_ST_TYPE_ABBRVS
         )
 
-        mock_config_get.side_effect = (
-            'invalid', new_addr_keys,
-            None, None, None, None, None,
-            new_problem_st, None, None,
-        )
+        mock_config_get.side_effect = _side_effect('invalid')
         self.assertRaises(
-            ConfigError, address_constants.set_address_constants
+            address_constants.ConfigError,
+            address_constants.set_address_constants
         )
 
+    @mock.patch.object(address_constants.NormalizationConfig, 'get')
+    def test_set_constants_refreshes_cleaning(self, mock_config_get):
+        addr_str = '456 MAIN ST ZZTOP 5'
+        line2 = 'QQ 33'
+        # warm the memoized cleaning results with the current constants.
+        self.assertEqual(addr_str, pre_clean_addr_str(addr_str))
+        self.assertEqual(line2, strip_occupancy_type(line2))
+
+        config = {
+            'insertion_method': 'update',
+            'KNOWN_ODDITIES': {'ZZTOP': 'UNIT'},
+            'OCCUPANCY_TYPE_ABBREVIATIONS': {'QQ': 'UNIT'},
+        }
+        abnormal_abbrvs = address_constants.ABNORMAL_OCCUPANCY_ABBRVS
+
+        def _config_get(key, default=None):
+            return config.get(key, default)
+
+        def _reset_constants():
+            del address_constants.KNOWN_ODDITIES['ZZTOP']
+            del address_constants.OCCUPANCY_TYPE_ABBREVIATIONS['QQ']
+            address_constants.set_address_constants()
+            address_constants.ABNORMAL_OCCUPANCY_ABBRVS = abnormal_abbrvs
+
+        mock_config_get.side_effect = _config_get
+        address_constants.set_address_constants()
+        self.addCleanup(_reset_constants)
+
+        self.assertEqual('456 MAIN ST UNIT 5', pre_clean_addr_str(addr_str))
+        self.assertEqual('33', strip_occupancy_type(line2))
+
+    @mock.patch.object(address_constants.NormalizationConfig, 'get')
+    def test_set_constants_mixed_case(self, mock_config_get):
+        config = {
+            'insertion_method': 'update',
+            'DIRECTIONAL_REPLACEMENTS': {'Nwest': 'nw'},
+            'STREET_TYPE_ABBREVIATIONS': {'Bvd': 'Blvd'},
+        }
+
+        def _config_get(key, default=None):
+            return config.get(key, default)
+
+        def _reset_constants():
+            for key in ('NWEST', 'Nwest'):
+                address_constants.DIRECTIONAL_REPLACEMENTS.pop(key, None)
+            for key in ('BVD', 'Bvd', 'BVD2'):
+                address_constants.STREET_TYPE_ABBREVIATIONS.pop(key, None)
+            address_constants.set_address_constants()
+
+        mock_config_get.side_effect = _config_get
+        self.addCleanup(_reset_constants)
+        address_constants.set_address_constants()
+
+        parsed_addr = OrderedDict([
+            ('AddressNumber', '123'),
+            ('StreetNamePreDirectional', 'NWEST'),
+            ('StreetName', 'MAIN'),
+            ('StreetNamePostType', 'BVD'),
+        ])
+        result = normalize_street_types(normalize_directionals(parsed_addr))
+        self.assertEqual('NW', result['StreetNamePreDirectional'])
+        self.assertEqual('BLVD', result['StreetNamePostType'])
+
+        config['STREET_TYPE_ABBREVIATIONS'] = {'BVD2': 2}
+        with self.assertRaises(address_constants.ConfigError):
+            address_constants.set_address_constants()
+
     def test_handle_abnormal_occupancy(self):
         addr_str = '123 SW MAIN UN'
         expected = OrderedDict([
@@ -6,37 +6,55 @@ All rights reserved
 """
 
 # Imports from Standard Library
-from unittest import TestCase
+import io
+from contextlib import redirect_stdout
+from unittest import TestCase, skipIf
 
 # Local Imports
-from scourgify.cleaning import strip_occupancy_type
+from scourgify.address_constants import CACHE_SIZE
+from scourgify.cleaning import (
+    post_clean_addr_str,
+    pre_clean_addr_str,
+    strip_occupancy_type,
+    tag_address,
+)
+
+# Constants
+STRIP_OCCUPANCY_CASES = (
+    'Unit 33',
+    'Apartment 33',
+    'Unit #33',
+    'Building 3 Unit 33',
+    'Building 3 UN 33',
+    '33',
+)
 
 
 class CleaningTests(TestCase):
 
     def test_strip_occupancy_type(self):
         expected = '33'
-
-        line2 = 'Unit 33'
-        result = strip_occupancy_type(line2)
-        self.assertEqual(result, expected)
-
-        line2 = 'Apartment 33'
-        result = strip_occupancy_type(line2)
-        self.assertEqual(result, expected)
-
-        line2 = 'Unit #33'
-        result = strip_occupancy_type(line2)
-        self.assertEqual(result, expected)
-
-        line2 = 'Building 3 Unit 33'
-        result = strip_occupancy_type(line2)
-        self.assertEqual(result, expected)
-
-        line2 = 'Building 3 UN 33'
-        result = strip_occupancy_type(line2)
-        self.assertEqual(result, expected)
-
-        line2 = '33'
-        result = strip_occupancy_type(line2)
-        self.assertEqual(result, expected)
+        for line2 in STRIP_OCCUPANCY_CASES:
+            with self.subTest(line2=line2):
+                self.assertEqual(expected, strip_occupancy_type(line2))
+
+    def test_strip_occupancy_type_is_silent(self):
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            strip_occupancy_type('Building 3 UN 33')
+        self.assertEqual(stdout.getvalue(), '')
+
+    @skipIf(not CACHE_SIZE, 'memoization is disabled')
+    def test_strip_occupancy_type_caches_tagging(self):
+        tag_address.cache_clear()
+        strip_occupancy_type('Unit 33')
+        strip_occupancy_type('Unit 33')
+        self.assertEqual(tag_address.cache_info().hits, 1)
+
+    @skipIf(not CACHE_SIZE, 'memoization is disabled')
+    def test_clean_addr_str_caches_results(self):
+        for clean_func in (pre_clean_addr_str, post_clean_addr_str):
+            clean_func.cache_clear()
+            first = clean_func('123 Nowhere St')
+            self.assertIs(first, clean_func('123 Nowhere St'))
+            self.assertEqual(clean_func.cache_info().hits, 1)
@@ -9,7 +9,7 @@ All rights reserved
 """
 # Imports from Standard Library
 import re
-from typing import Mapping, Union
+from typing import Iterable, List, Mapping, Optional, Union
 
 # Local Imports
 # Public Classes and Functions
@@ -23,6 +23,7 @@ from scourgify.exceptions import (
 # Setup
 
 # Constants
+_ASCII_DIGITS = '0123456789'
 
 # Data Structure Definitions
 
@@ -45,6 +46,46 @@ def _get_substrings_with_regex(string, pattern=None):
     return match
 
 
+def _normalize_us_postal_code(postal_code, pre_cleaned=False):
+    # type: (str, bool) -> Optional[str]
+    """Normalize a US postal code to five-digit Zip or Zip+4 format.
+
+    :param postal_code: string containing US postal code data.
+    :type postal_code: str
+    :param pre_cleaned: bool indicating postal_code has already been passed
+        through post_clean_addr_str
+    :type pre_cleaned: bool
+    :return: normalized postal code, or None if it cannot be normalized.
+    :rtype: str | None
+    """
+    # fast path for codes already in canonical zip or zip+4 form. Non-str
+    # codes (ie int zips from csv or json data) are coerced by cleaning.
+    if isinstance(postal_code, str):
+        length = len(postal_code)
+        if length == 5 and not postal_code.strip(_ASCII_DIGITS):
+            return postal_code
+        elif (length == 10 and postal_code[5] == '-' and
+                not postal_code[:5].strip(_ASCII_DIGITS) and
+                not postal_code[6:].strip(_ASCII_DIGITS)):
+            return postal_code
+
+    if not pre_cleaned:
+        postal_code = post_clean_addr_str(postal_code)
+    zip_code, dash, plus_four = postal_code.partition('-')
+    # only ascii digits are accepted on either side of a single dash;
+    # stripping the digits leaves nothing behind if that is all they hold.
+    if not (zip_code.strip(_ASCII_DIGITS) or plus_four.strip(_ASCII_DIGITS)):
+        if not dash:
+            if len(zip_code) == 9:
+                return f'{zip_code[:5]}-{zip_code[5:]}'
+            elif 0 < len(zip_code) <= 5:
+                return zip_code.zfill(5)
+        # both sides of the dash must hold digits, no more than 9 in total
+        elif zip_code and plus_four and len(zip_code) + len(plus_four) <= 9:
+            return f'{zip_code:0>5}-{plus_four:0>4}'
+    return None
+
+
 # Public Functions
 def validate_address_components(address_dict, strict=True):
     # type: (Mapping[str, str]) -> Mapping[str, str]
@@ -61,69 +102,77 @@ def validate_address_components(address_dict, strict=True):
     :return: address_dict if no errors are raised.
     :rtype: Mapping
     """
-    locality = (
-        address_dict.get('postal_code') and
-        address_dict.get('city') and address_dict.get('state')
-        if strict else
-        address_dict.get('postal_code') or
-        (address_dict.get('city') and address_dict.get('state'))
-    )
     if not address_dict.get('address_line_1'):
-        msg = 'Address records must include Line 1 data.'
-        raise IncompleteAddressError(msg)
-    elif not locality:
-        msg = (
+        raise IncompleteAddressError(
+            'Address records must include Line 1 data.'
+        )
+    elif strict:
+        if (address_dict.get('postal_code') and address_dict.get('city') and
+                address_dict.get('state')):
+            return address_dict
+        raise IncompleteAddressError(
             'Address records must contain a city, state, and postal_code.'
-            if strict else
-            'Address records must contain a city and state, or a postal_code'
         )
-        raise IncompleteAddressError(msg)
-    return address_dict
+    elif (address_dict.get('postal_code') or
+            (address_dict.get('city') and address_dict.get('state'))):
+        return address_dict
+    raise IncompleteAddressError(
+        'Address records must contain a city and state, or a postal_code'
+    )
 
 
-def validate_us_postal_code_format(postal_code, address):
-    # type: (str, Union[str, Mapping]) -> str
+def validate_us_postal_code_format(postal_code, address, pre_cleaned=False):
+    # type: (str, Union[str, Mapping], bool) -> str
     """Validate postal code conforms to US five-digit Zip or Zip+4 standards.
 
     :param postal_code: string containing US postal code data.
     :type postal_code: str
     :param address: dict or string containing original address.
     :type address: dict | str
+    :param pre_cleaned: bool indicating postal_code has already been passed
+        through post_clean_addr_str, so it is not cleaned again.
+    :type pre_cleaned: bool
     :return: original postal code if no error is raised
     :rtype: str
     """
-    error = None
-    msg = (
-        'US Postal Codes must conform to five-digit Zip or Zip+4 standards.'
-    )
-    postal_code = post_clean_addr_str(postal_code)
-    plus_four_code = postal_code.split('-')
-    for code in plus_four_code:
+    normalized = _normalize_us_postal_code(postal_code, pre_cleaned)
+    if normalized is None:
+        raise AddressValidationError(
+            'US Postal Codes must conform to five-digit Zip or Zip+4 '
+            'standards.', None, address
+        )
+    return normalized
+
+
+def validate_us_postal_codes(postal_codes):
+    # type: (Iterable[str]) -> List[Optional[str]]
+    """Normalize a batch of US postal codes to five-digit Zip or Zip+4.
+
+    Unlike validate_us_postal_code_format, codes that cannot be normalized
+    do not raise AddressValidationError; None is returned in their place so
+    one bad record does not discard the rest of the batch. Postal codes
+    repeat heavily across large address sets, so each distinct code is only
+    normalized once.
+
+    :param postal_codes: iterable of strings containing US postal code data.
+    :type postal_codes: Iterable[str]
+    :return: list of normalized postal codes, or None for each code that
+        does not conform to Zip or Zip+4 standards, in the same order as
+        supplied.
+    :rtype: list
+    """
+    normalized = {}
+    results = []
+    for postal_code in postal_codes:
+        # equal values of different types (97009, 97009.0) may normalize
+        # differently, so they must not share a result.
+        key = (type(postal_code), postal_code)
         try:
-            int(code)
-        except ValueError:
-            error = True
-    if not error:
-        if '-' in postal_code:
-            if len(postal_code.replace('-', '')) > 9:
-                error = True
-            elif len(plus_four_code) != 2:
-                error = True
-            else:
-                postal_code = '-'.join([
-                    plus_four_code[0].zfill(5), plus_four_code[1].zfill(4)
-                ])
-        elif len(postal_code) == 9:
-            postal_code = '-'.join([postal_code[:5], postal_code[5:]])
-        elif len(postal_code) > 5:
-            error = True
-        else:
-            postal_code = postal_code.zfill(5)
-
-    if error:
-        raise AddressValidationError(msg, None, address)
-    else:
-        return postal_code
+            result = normalized[key]
+        except KeyError:
+            result = normalized[key] = _normalize_us_postal_code(postal_code)
+        results.append(result)
+    return results
 
 
 def validate_parens_groups_parsed(line1):
@@ -140,8 +189,10 @@ def validate_parens_groups_parsed(line1):
     :return: line1 address string
     :rtype: str
     """
-    parenthesis_groups = _get_substrings_with_regex(line1, r'\((.+?)\)')
-    if parenthesis_groups:
+    # a parenthesis group holds at least one character, ie '(BLDG A1)', so
+    # the closing paren is searched for from one past the first open paren.
+    open_idx = line1.find('(')
+    if open_idx != -1 and line1.find(')', open_idx + 2) != -1:
         raise AmbiguousAddressError(None, None, line1)
     else:
         return line1